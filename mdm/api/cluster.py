@@ -35,6 +35,10 @@ class ClusterNodeRegister(BaseModel):
     metadata: Optional[Dict[str, Any]] = None
 
 
+class ClusterNodeRegisterBulk(BaseModel):
+    nodes: List[ClusterNodeRegister] = Field(min_length=1)
+
+
 class ClusterNodeHeartbeat(BaseModel):
     status: Optional[ClusterNodeStatus] = None
     capabilities: Optional[List[str]] = None
@@ -103,8 +107,7 @@ def _resolve_ports(payload: ClusterNodeRegister, capabilities: List[str]) -> Tup
     return int(control_port), int(data_port) if data_port else None
 
 
-@router.post("/cluster/nodes/register")
-def register_node(payload: ClusterNodeRegister, db: Session = Depends(get_db)):
+def _upsert_node(db: Session, payload: ClusterNodeRegister) -> ClusterNode:
     capabilities = _normalize_capabilities(payload.capabilities)
     control_port, data_port = _resolve_ports(payload, capabilities)
 
@@ -135,12 +138,31 @@ def register_node(payload: ClusterNodeRegister, db: Session = Depends(get_db)):
         setattr(node, "last_heartbeat", datetime.utcnow())
         if payload.metadata:
             setattr(node, "metadata_json", json.dumps(payload.metadata))
+    return node
+
 
+@router.post("/cluster/nodes/register")
+def register_node(payload: ClusterNodeRegister, db: Session = Depends(get_db)):
+    node = _upsert_node(db, payload)
     db.commit()
     db.refresh(node)
     return {"registered": True, "node": _serialize_node(node)}
 
 
+@router.post("/cluster/nodes/register_bulk")
+def register_nodes_bulk(payload: ClusterNodeRegisterBulk, db: Session = Depends(get_db)):
+    # All-or-nothing: one validation failure rejects the batch before anything is committed
+    node_ids = [item.node_id for item in payload.nodes]
+    duplicates = sorted({node_id for node_id in node_ids if node_ids.count(node_id) > 1})
+    if duplicates:
+        raise HTTPException(status_code=400, detail=f"Duplicate node_id in batch: {', '.join(duplicates)}")
+    nodes =[_upsert_node(db, item) for item in payload.nodes]
+    db.commit()
+    for node in nodes:
+        db.refresh(node)
+    return {"registered": True, "count": len(nodes), "nodes": [_serialize_node(node) for node in nodes]}
+
+
 @router.post("/cluster/nodes/{node_id}/heartbeat")
 def heartbeat_node(node_id: str, payload: ClusterNodeHeartbeat, db: Session = Depends(get_db)):
     node = db.scalars(select(ClusterNode).where(ClusterNode.node_id == node_id)).first()
@@ -0,0 +1,65 @@
+"""
+MDM MGMT Bulk API
+
+Single-request snapshot of everything the MGMT component monitor polls.
+Lets MGMT refresh its dashboard cache with one GET instead of six.
+
+Endpoints:
+- GET /mgmt/bulk: health summary, component health, health metrics,
+  pool list, volume list and cluster topology in one document
+  (optional ?keys=a,b to return only some sections)
+
+Responses carry an ETag; a matching If-None-Match gets 304 with no body.
+Health sections embed timestamps and change on every call, so clients that
+want 304s should request the slow-changing sections (pools, volumes,
+topology) separately.
+"""
+
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+import hashlib
+from typing import Optional
+
+from mdm.api import discovery, health, pool, volume
+from mdm.database import SessionLocal
+
+router = APIRouter(prefix="/mgmt", tags=["mgmt"])
+
+
+def get_db():
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def _etag_response(request: Request, content) -> Response:
+    """Serialize content once, tag it, and short-circuit to 304 if the client has it"""
+    response = JSONResponse(jsonable_encoder(content))
+    etag = '"%s"' % hashlib.blake2b(response.body, digest_size=8).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return response
+
+
+@router.get("/bulk")
+def get_bulk_snapshot(request: Request, keys: Optional[str] = None, db: Session = Depends(get_db)):
+    """
+    Get the MGMT monitor snapshot.
+    Keys match the MGMT cache keys; each value has the same shape as the
+    corresponding individual endpoint. All DB reads share one session.
+    """
+    sections = {
+        "health_summary": lambda: health.HealthSummary(**health.get_health_summary()),
+        "component_health": lambda: [health.ComponentStatus(**c) for c in health.get_component_statuses()],
+        "health_metrics": health.get_health_metrics,
+        "pool_list": lambda: pool.list_pools(db),
+        "volume_list": lambda: volume.list_vols(db),
+        "cluster_topology": lambda: discovery.get_topology(db),
+    }
+    wanted = [k for k in keys.split(",") if k in sections] if keys else list(sections)
+    return _etag_response(request, {key: sections[key]() for key in wanted})
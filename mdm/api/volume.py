@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
 import os
 import base64
 import hashlib
@@ -14,8 +14,9 @@ from mdm.services.capability_guard import has_active_capability
 from mdm.services.volume_manager import VolumeManager
 from mdm.services.real_storage import RealStorageBackend
 from shared.sdc_socket_client import SDCSocketClient
-from mdm.logic import create_volume, map_volume, unmap_volume, extend_volume, delete_volume
-from pydantic import BaseModel
+from mdm.logic import create_volume, map_volume, unmap_volume, unmap_volume_all, extend_volume, delete_volume
+from pydantic import BaseModel, Field
+from typing import List, Literal
 
 router = APIRouter()
 
@@ -119,6 +120,18 @@ class VolumeReadRequest(BaseModel):
     length_bytes: int
 
 
+class VolumeIOBatchOp(BaseModel):
+    op: Literal["write", "read"]
+    offset_bytes: int
+    data_b64: str = ""
+    length_bytes: int = 0
+
+
+class VolumeIOBatchRequest(BaseModel):
+    sdc_id: int
+    ops: List[VolumeIOBatchOp] = Field(min_length=1)
+
+
 class VolumeIOPlanRequest(BaseModel):
     sdc_id: int
     offset_bytes: int = 0
@@ -329,6 +342,17 @@ def unmap_vol(volume_id: int, sdc_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=400, detail=str(exc))
     return {"status": "unmapped"}
 
+@router.post("/vol/{volume_id}/unmap_all")
+def unmap_vol_all(volume_id: int, db: Session = Depends(get_db)):
+    # Idempotent: a volume with no mappings unmaps 0 and still succeeds
+    if not has_active_capability(db, "MDM"):
+        raise HTTPException(status_code=400, detail="No ACTIVE MDM-capable node available")
+    try:
+        count = unmap_volume_all(volume_id, db)
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    return {"status": "unmapped", "unmapped": count}
+
 @router.post("/vol/extend")
 def extend_vol(volume_id: int, new_size_gb: float, db: Session = Depends(get_db)):
     if not has_active_capability(db, "MDM"):
@@ -548,11 +572,28 @@ def plan_volume_read(volume_id: int, payload: VolumeIOPlanRequest, db: Session =
 
 @router.post("/vol/{volume_id}/io/write")
 def write_volume_bytes(volume_id: int, payload: VolumeWriteRequest, db: Session = Depends(get_db)):
+    return _write_volume_data(db, volume_id, payload.sdc_id, payload.offset_bytes, payload.data_b64)
+
+
+@router.post("/vol/{volume_id}/io/write_raw")
+def write_volume_raw(
+    volume_id: int,
+    sdc_id: int,
+    offset_bytes: int,
+    data: bytes = Body(..., media_type="application/octet-stream"),
+    db: Session = Depends(get_db),
+):
+    # Same as /io/write, but the request body is the raw bytes (no base64/JSON wrapping)
+    return _write_volume_data(db, volume_id, sdc_id, offset_bytes, data)
+
+
+def _write_volume_data(db: Session, volume_id: int, sdc_id: int, offset_bytes: int, data: bytes | str):
+    """Write to a volume; data is raw bytes or base64 text from the JSON API."""
     if not has_active_capability(db, "MDM"):
         raise HTTPException(status_code=400, detail="No ACTIVE MDM-capable node available")
 
     mapping = db.scalars(select(VolumeMapping).where(
-        VolumeMapping.volume_id == volume_id, VolumeMapping.sdc_id == payload.sdc_id
+        VolumeMapping.volume_id == volume_id, VolumeMapping.sdc_id == sdc_id
     )).first()
     if not mapping:
         raise HTTPException(status_code=403, detail="Volume is not mapped to this SDC")
@@ -581,11 +622,12 @@ def write_volume_bytes(volume_id: int, payload: VolumeWriteRequest, db: Session
     write_policy = _write_ack_policy()
 
     try:
-        data = backend.decode_base64(payload.data_b64)
+        if isinstance(data, str):
+            data = backend.decode_base64(data)
         if len(data) == 0:
             raise HTTPException(status_code=400, detail="No data provided for write")
 
-        segments = _build_chunk_segments(db, volume_obj, payload.offset_bytes, len(data))
+        segments = _build_chunk_segments(db, volume_obj, offset_bytes, len(data))
         if not segments:
             raise HTTPException(status_code=400, detail="No segments generated for write")
 
@@ -595,7 +637,7 @@ def write_volume_bytes(volume_id: int, payload: VolumeWriteRequest, db: Session
 
         for segment in segments:
             segment_len = int(segment.get("segment_length_bytes", 0) or 0)
-            segment_offset = int(segment.get("segment_offset_bytes", payload.offset_bytes) or payload.offset_bytes)
+            segment_offset = int(segment.get("segment_offset_bytes", offset_bytes) or offset_bytes)
             targets = segment.get("targets", []) or []
             if segment_len <= 0:
                 continue
@@ -652,7 +694,7 @@ def write_volume_bytes(volume_id: int, payload: VolumeWriteRequest, db: Session
             cursor += segment_len
 
         if io_path == "local":
-            replicas_written = backend.write_to_replica_paths(replica_paths, payload.offset_bytes, data)
+            replicas_written = backend.write_to_replica_paths(replica_paths, offset_bytes, data)
 
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc))
@@ -662,8 +704,8 @@ def write_volume_bytes(volume_id: int, payload: VolumeWriteRequest, db: Session
     return {
         "status": "written",
         "volume_id": volume_id,
-        "sdc_id": payload.sdc_id,
-        "offset_bytes": payload.offset_bytes,
+        "sdc_id": sdc_id,
+        "offset_bytes": offset_bytes,
         "bytes_written": len(data),
         "replicas_written": replicas_written,
         "io_path": io_path,
@@ -674,11 +716,61 @@ def write_volume_bytes(volume_id: int, payload: VolumeWriteRequest, db: Session
 
 @router.post("/vol/{volume_id}/io/read")
 def read_volume_bytes(volume_id: int, payload: VolumeReadRequest, db: Session = Depends(get_db)):
+    data, io_path, io_mode = _read_volume_data(db, volume_id, payload.sdc_id, payload.offset_bytes, payload.length_bytes)
+    return _read_response(volume_id, payload.sdc_id, payload.offset_bytes, data, io_path, io_mode)
+
+
+def _read_response(volume_id: int, sdc_id: int, offset_bytes: int, data: bytes, io_path: str, io_mode: str) -> dict:
+    utf8_text = None
+    try:
+        utf8_text = data.decode("utf-8")
+    except Exception:
+        utf8_text = None
+
+    return {
+        "status": "read",
+        "volume_id": volume_id,
+        "sdc_id": sdc_id,
+        "offset_bytes": offset_bytes,
+        "bytes_read": len(data),
+        "data_b64": RealStorageBackend.encode_base64(data),
+        "utf8_text": utf8_text,
+        "io_path": io_path,
+        "io_mode": io_mode,
+    }
+
+
+@router.post("/vol/{volume_id}/io/batch")
+def batch_volume_io(volume_id: int, payload: VolumeIOBatchRequest, db: Session = Depends(get_db)):
+    # Runs the ops in order in one HTTP round-trip; the first failing op aborts the batch
+    results = []
+    for op in payload.ops:
+        if op.op == "write":
+            results.append(_write_volume_data(db, volume_id, payload.sdc_id, op.offset_bytes, op.data_b64))
+        else:
+            data, io_path, io_mode = _read_volume_data(db, volume_id, payload.sdc_id, op.offset_bytes, op.length_bytes)
+            results.append(_read_response(volume_id, payload.sdc_id, op.offset_bytes, data, io_path, io_mode))
+    return {"status": "ok", "volume_id": volume_id, "sdc_id": payload.sdc_id, "results": results}
+
+
+@router.get("/vol/{volume_id}/io/read_raw")
+def read_volume_raw(volume_id: int, sdc_id: int, offset_bytes: int, length_bytes: int, db: Session = Depends(get_db)):
+    # Same as /io/read, but the response body is the raw bytes (no base64/JSON wrapping)
+    data, io_path, io_mode = _read_volume_data(db, volume_id, sdc_id, offset_bytes, length_bytes)
+    return Response(
+        content=data,
+        media_type="application/octet-stream",
+        headers={"X-IO-Path": io_path, "X-IO-Mode": io_mode},
+    )
+
+
+def _read_volume_data(db: Session, volume_id: int, sdc_id: int, offset_bytes: int, length_bytes: int):
+    """Read from a volume; returns (data, io_path, io_mode)."""
     if not has_active_capability(db, "MDM"):
         raise HTTPException(status_code=400, detail="No ACTIVE MDM-capable node available")
 
     mapping = db.scalars(select(VolumeMapping).where(
-        VolumeMapping.volume_id == volume_id, VolumeMapping.sdc_id == payload.sdc_id
+        VolumeMapping.volume_id == volume_id, VolumeMapping.sdc_id == sdc_id
     )).first()
     if not mapping:
         raise HTTPException(status_code=403, detail="Volume is not mapped to this SDC")
@@ -701,10 +793,10 @@ def read_volume_bytes(volume_id: int, payload: VolumeReadRequest, db: Session =
     io_mode = _io_mode()
 
     try:
-        if int(payload.length_bytes or 0) <= 0:
+        if int(length_bytes or 0) <= 0:
             raise HTTPException(status_code=400, detail="length_bytes must be > 0")
 
-        segments = _build_chunk_segments(db, volume_obj, payload.offset_bytes, payload.length_bytes)
+        segments = _build_chunk_segments(db, volume_obj, offset_bytes, length_bytes)
         if not segments:
             raise HTTPException(status_code=400, detail="No segments generated for read")
 
@@ -713,7 +805,7 @@ def read_volume_bytes(volume_id: int, payload: VolumeReadRequest, db: Session =
 
         for segment in segments:
             segment_len = int(segment.get("segment_length_bytes", 0) or 0)
-            segment_offset = int(segment.get("segment_offset_bytes", payload.offset_bytes) or payload.offset_bytes)
+            segment_offset = int(segment.get("segment_offset_bytes", offset_bytes) or offset_bytes)
             targets = segment.get("targets", []) or []
             if segment_len <= 0:
                 continue
@@ -755,27 +847,11 @@ def read_volume_bytes(volume_id: int, payload: VolumeReadRequest, db: Session =
             parts.append(read_part)
 
         if io_path == "local":
-            data = backend.read_from_replica_paths(replica_paths, payload.offset_bytes, payload.length_bytes)
+            data = backend.read_from_replica_paths(replica_paths, offset_bytes, length_bytes)
         else:
             data = b"".join(parts)
 
     except Exception as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    utf8_text = None
-    try:
-        utf8_text = data.decode("utf-8")
-    except Exception:
-        utf8_text = None
-
-    return {
-        "status": "read",
-        "volume_id": volume_id,
-        "sdc_id": payload.sdc_id,
-        "offset_bytes": payload.offset_bytes,
-        "bytes_read": len(data),
-        "data_b64": backend.encode_base64(data),
-        "utf8_text": utf8_text,
-        "io_path": io_path,
-        "io_mode": io_mode,
-    }
+    return data, io_path, io_mode
@@ -109,7 +109,6 @@ class HealthMonitor:
                     if current_status == "ACTIVE":
                         # Mark as INACTIVE
                         component.status = "INACTIVE"  # type: ignore[assignment]
-                        db.commit()
                         
                         time_since_last = (now - last_heartbeat).total_seconds()
                         logger.warning(f"Component {component_id} marked INACTIVE (no heartbeat for {time_since_last:.1f}s)")
@@ -125,7 +124,6 @@ class HealthMonitor:
                     if current_status == "INACTIVE":
                         # Component recovered
                         component.status = "ACTIVE"  # type: ignore[assignment]
-                        db.commit()
                         
                         logger.info(f"Component {component_id} recovered (status → ACTIVE)")
                         recovered_count += 1
@@ -133,6 +131,8 @@ class HealthMonitor:
                         self._generate_alert(db, component_id, "COMPONENT_RECOVERED", "Component is back online")
             
             if inactive_count > 0 or recovered_count > 0:
+                # One commit for every status flip in this sweep
+                db.commit()
                 logger.info(f"Health check: {inactive_count} components marked INACTIVE, {recovered_count} recovered")
         
         finally:
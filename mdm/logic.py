@@ -10,6 +10,7 @@ from mdm.models import (
     SDSNode,
     StoragePool,
     Volume,
+    VolumeMapping,
     SDSNodeState,
     ProvisioningType,
 )
@@ -102,6 +103,19 @@ def unmap_volume(volume_id: int, sdc_id: int, session: Session):
         raise Exception(f"Volume unmapping failed: {msg}")
 
 
+def unmap_volume_all(volume_id: int, session: Session) -> int:
+    """Unmap volume from every SDC it is mapped to; returns the number of mappings removed."""
+    if session.get(Volume, volume_id) is None:
+        raise Exception("Volume not found")
+    sdc_ids = session.scalars(select(VolumeMapping.sdc_id).where(VolumeMapping.volume_id == volume_id)).all()
+    mgr = get_volume_manager(session)
+    for sdc_id in sdc_ids:
+        success, msg = mgr.unmap_volume(volume_id, sdc_id)
+        if not success:
+            raise Exception(f"Volume unmapping failed: {msg}")
+    return len(sdc_ids)
+
+
 # ============================================================================
 # VOLUME EXTENSION (delegated to VolumeManager)
 # ============================================================================
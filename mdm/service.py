@@ -11,7 +11,7 @@ from fastapi import FastAPI
 import os
 import logging
 
-from mdm.api import pd, pool, sds, sdc, volume, metrics, rebuild, cluster, discovery, token, health
+from mdm.api import pd, pool, sds, sdc, volume, metrics, rebuild, cluster, discovery, token, health, mgmt
 from mdm.database import init_db, SessionLocal
 from mdm.startup_profile import StartupProfile, validate_mdm_profile
 from mdm.health_monitor import HealthMonitor
@@ -32,6 +32,7 @@ app.include_router(cluster.router)
 app.include_router(discovery.router)  # Phase 2: Discovery & Registration
 app.include_router(token.router)  # Phase 4: IO Authorization Tokens
 app.include_router(health.router)  # Phase 7: Health Monitoring
+app.include_router(mgmt.router)  # MGMT bulk snapshot (one GET per monitor cycle)
 
 # Global health monitor instance
 health_monitor = None
@@ -8,7 +8,7 @@ Every IO transaction requires a token signed by MDM and verified by SDS.
 import json
 from datetime import datetime
 from sqlalchemy.orm import Session
-from sqlalchemy import select, func
+from sqlalchemy import select, func, bindparam
 from typing import Dict, List, Optional
 
 from shared.token_utils import (
@@ -29,6 +29,9 @@ class TokenAuthority:
     - Enforce token expiry and revocation
     """
     
+    # Built once so SQLAlchemy's compiled-statement cache is hit on every lookup
+    _GET_TOKEN_STMT = select(IOToken).where(IOToken.token_id == bindparam("tid"))
+    
     def __init__(self, db: Session, cluster_secret: str):
         """
         Initialize token authority.
@@ -72,14 +75,14 @@ class TokenAuthority:
         if operation not in ("read", "write"):
             raise ValueError(f"Invalid operation: {operation}")
         
-        # Verify volume exists
-        volume = self.db.scalars(select(Volume).where(Volume.id == volume_id)).first()
-        if not volume:
+        # Verify volume and SDC exist (one round-trip for both checks)
+        exists = self.db.execute(select(
+            select(func.count()).select_from(Volume).where(Volume.id == volume_id).scalar_subquery().label("volume"),
+            select(func.count()).select_from(SDCClient).where(SDCClient.id == sdc_id).scalar_subquery().label("sdc")
+        )).one()
+        if not exists.volume:
             raise ValueError(f"Volume {volume_id} not found")
-        
-        # Verify SDC exists
-        sdc = self.db.scalars(select(SDCClient).where(SDCClient.id == sdc_id)).first()
-        if not sdc:
+        if not exists.sdc:
             raise ValueError(f"SDC {sdc_id} not found")
         
         # Generate token
@@ -104,7 +107,6 @@ class TokenAuthority:
             operation=operation,
             offset_bytes=offset_bytes,
             length_bytes=length_bytes,
-            issued_at=datetime.utcnow(),
             expires_at=expires_at,
             signature=signature,
             io_plan_json=json.dumps(io_plan),
@@ -132,7 +134,7 @@ class TokenAuthority:
     
     def get_token(self, token_id: str) -> Optional[IOToken]:
         """Fetch token by ID"""
-        return self.db.scalars(select(IOToken).where(IOToken.token_id == token_id)).first()
+        return self.db.scalars(self._GET_TOKEN_STMT, {"tid": token_id}).first()
     
     def mark_token_consumed(self, token_id: str) -> bool:
         """
@@ -182,7 +184,7 @@ class TokenAuthority:
             metadata: Additional metadata (JSON)
         
         Returns:
-            Created IOTransactionAck record
+            Created IOTransactionAck record (detached from the session)
         """
         # Mark token as consumed if successful
         if success:
@@ -196,15 +198,18 @@ class TokenAuthority:
             success=success,
             error_message=error_message,
             bytes_processed=bytes_processed,
-            received_at=datetime.utcnow(),
             execution_duration_ms=execution_duration_ms,
             sds_address=sds_address,
             metadata_json=json.dumps(metadata) if metadata else None
         )
         
+        # Flush assigns id (received_at comes from its Python default); detach
+        # before commit so the loaded state isn't expired and reloaded by
+        # callers reading the ACK.
         self.db.add(ack)
+        self.db.flush()
+        self.db.expunge(ack)
         self.db.commit()
-        self.db.refresh(ack)
         
         return ack
     
@@ -291,16 +291,19 @@ def get_alert_history_summary(hours: int = 24) -> Dict[str, Any]:
         db.close()
 
 
-def format_alert_for_display(alert: Alert) -> Dict[str, Any]:
+def format_alert_for_display(alert: Alert, now: Optional[datetime] = None) -> Dict[str, Any]:
     """
     Format alert object for GUI display.
     
     Args:
         alert: Alert database object (AlertHistory)
+        now: Reference time for age_seconds (default: current UTC time)
     
     Returns:
         Dictionary with formatted alert data
     """
+    if now is None:
+        now = datetime.utcnow()
     return {
         "id": alert.id,
         "severity": alert.severity.value if alert.severity else "info",
@@ -308,9 +311,24 @@ def format_alert_for_display(alert: Alert) -> Dict[str, Any]:
         "message": alert.message or "",
         "component_id": alert.component_id or "",
         "fired_at": alert.fired_at.isoformat() if alert.fired_at else None,
-        "age_seconds": (datetime.utcnow() - alert.fired_at).total_seconds() if alert.fired_at else 0,
+        "age_seconds": (now - alert.fired_at).total_seconds() if alert.fired_at else 0,
         "acknowledged_at": alert.acknowledged_at.isoformat() if alert.acknowledged_at else None,
         "resolved_at": alert.resolved_at.isoformat() if alert.resolved_at else None,
         "metric_value": alert.metric_value,
         "threshold_value": alert.threshold_value,
     }
+
+
+def format_alerts_for_display(alerts: List[Alert]) -> List[Dict[str, Any]]:
+    """
+    Format a batch of alerts for GUI display.
+    All ages are measured against one timestamp, so a page's alerts are consistent.
+    
+    Args:
+        alerts: Alert database objects (AlertHistory)
+    
+    Returns:
+        List of formatted alert dictionaries
+    """
+    now = datetime.utcnow()
+    return [format_alert_for_display(alert, now) for alert in alerts]
@@ -8,7 +8,7 @@ This database is owned exclusively by the MGMT component.
 import os
 from pathlib import Path
 
-from sqlalchemy import create_engine, text, inspect
+from sqlalchemy import create_engine, event, text, inspect
 from sqlalchemy.orm import sessionmaker, scoped_session
 from mgmt.models import Base, User, UserRole, MGMTConfig, AlertRule, AlertSeverity
 import bcrypt
@@ -24,10 +24,28 @@ engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
 SessionLocal = scoped_session(sessionmaker(autocommit=False, autoflush=False, bind=engine))
 
 
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Tune every new mgmt.db connection.
+        WAL lets dashboard reads proceed while alerts are being written;
+        synchronous=NORMAL is crash-safe under WAL with one fsync per checkpoint.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        cursor.close()
+
+
 def init_db():
     """
     Initialize mgmt.db database with schema and seed data.
     Creates all tables and adds default admin user + alert rules.
+    Returns the SQLite journal mode in effect (None for other backends).
     """
     logger.info("Initializing MGMT database (mgmt.db)...")
     
@@ -35,6 +53,13 @@ def init_db():
     Base.metadata.create_all(bind=engine)
     logger.info("MGMT database schema created")
     
+    journal_mode = None
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as conn:
+            journal_mode = conn.execute(text("PRAGMA journal_mode")).scalar()
+        if str(journal_mode).lower() != "wal":
+            logger.warning(f"mgmt.db journal_mode is {journal_mode}, expected wal")
+    
     # Run migrations (additive only)
     _run_migrations()
     
@@ -42,6 +67,21 @@ def init_db():
     _seed_default_data()
     
     logger.info("MGMT database initialization complete")
+    return journal_mode
+
+
+def optimize_db():
+    """
+    Refresh SQLite query-planner statistics for mgmt.db.
+    PRAGMA optimize only re-analyzes tables whose contents changed; cheap enough for shutdown.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("PRAGMA optimize"))
+    except Exception as e:
+        logger.warning(f"mgmt.db PRAGMA optimize failed: {e}")
 
 
 def _run_migrations():
@@ -5,32 +5,101 @@ Polls key MDM endpoints in a background thread and stores an in-memory cache
 for dashboard rendering.
 """
 
+import json
 import logging
 import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 logger = logging.getLogger(__name__)
 
+# Hard cap on cached keys; least recently written entries are evicted first
+MAX_CACHE_KEYS = 64
+
 _cache_lock = threading.Lock()
-_cache_data: Dict[str, Any] = {}
-_cache_ts: Dict[str, datetime] = {}
+_cache_data: "OrderedDict[str, Any]" = OrderedDict()
+_cache_ts: Dict[str, float] = {}  # time.time() of last refresh, for display only
+_cache_deadline: Dict[str, float] = {}  # time.monotonic() after which an entry is stale
+_cache_version = 0  # Bumped whenever cached data changes (not on plain TTL refresh)
+_last_poll_ts = 0.0  # time.time() at which the monitor last finished a poll cycle (0 = never)
+_invalidation_seq = 0  # Bumped by every invalidate_cached_data() call
+_stale_keys: Dict[str, int] = {}  # key -> invalidation seq that marked it stale (value is still served)
+_refresh_pending: set = set()  # Stale keys the monitor refetches on its next tick, regardless of interval
+
+# Returned by _http_get when MDM answers 304 to our If-None-Match
+_NOT_MODIFIED = object()
 
 
 def get_cached_data(key: str) -> Optional[Any]:
+    # Single-key dict reads are atomic under the GIL; only writers take the lock.
+    # TTL check is a float compare, no datetime/timedelta allocation.
+    if time.monotonic() > _cache_deadline.get(key, 0.0):
+        return None
+    return _cache_data.get(key)
+
+
+def get_fresh_cached_data(key: str) -> Optional[Any]:
+    # Like get_cached_data, but None for entries invalidated since their last refresh,
+    # so callers that must reflect a write fall through to MDM
+    if key in _stale_keys:
+        return None
+    return get_cached_data(key)
+
+
+def get_cache_version() -> int:
+    # Lets callers memoize work derived from the cache until it changes
+    return _cache_version
+
+
+def invalidate_cached_data(*keys: str):
+    # Mark entries stale (e.g. after a write) without dropping them: get_cached_data keeps
+    # serving the last value, get_fresh_cached_data skips it, and the monitor refetches
+    # those keys' group on its next tick instead of waiting out the group interval.
+    global _cache_version, _invalidation_seq
     with _cache_lock:
-        return _cache_data.get(key)
+        _cache_version += 1
+        _invalidation_seq += 1
+        for key in keys:
+            _stale_keys[key] = _invalidation_seq
+            _refresh_pending.add(key)
+
+
+def get_last_poll_time() -> float:
+    # Lets clients wait for a fresh poll instead of sleeping a fixed interval
+    return _last_poll_ts
 
 
 def get_all_cached_keys() -> Dict[str, str]:
     with _cache_lock:
-        return {k: v.isoformat() for k, v in _cache_ts.items()}
+        return {k: datetime.utcfromtimestamp(v).isoformat() for k, v in _cache_ts.items()}
 
 
 class ComponentMonitor:
+    # Cache key -> MDM path, used when /mgmt/bulk is unavailable
+    ENDPOINTS = {
+        "health_summary": "/health",
+        "component_health": "/health/components",
+        "health_metrics": "/health/metrics",
+        "pool_list": "/pool/list",
+        "volume_list": "/vol/list",
+        "cluster_topology": "/discovery/topology",
+    }
+    # /mgmt/bulk requests and how often each is due (seconds; None = every cycle).
+    # Health changes on every heartbeat; pools/volumes/topology change in minutes
+    # and usually revalidate to a 304.
+    BULK_GROUPS = (
+        (("health_summary", "component_health", "health_metrics"), None),
+        (("pool_list", "volume_list"), 60),
+        (("cluster_topology",), 120),
+    )
+
     def __init__(
         self,
         mdm_base_url: str = "http://127.0.0.1:8001",
@@ -46,71 +115,195 @@ class ComponentMonitor:
         self.retry_delay = retry_delay
 
         self._running = False
+        self._stop_event = threading.Event()  # Wakes the poll loop's sleep on stop()
         self._thread: Optional[threading.Thread] = None
         self._session = requests.Session()
+        # Keep-alive pool sized for the concurrent poll workers (all traffic goes to MDM).
+        # Retries live in the transport: only connection errors, timeouts and 5xx are
+        # retried (GET is idempotent); a 4xx comes straight back with no backoff.
+        retry = Retry(
+            total=max(max_retries - 1, 0),
+            backoff_factor=retry_delay,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+        # Fallback fan-out: one worker per endpoint so a cycle costs the slowest GET, not the sum
+        self._executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="mgmt-poll")
+        # (bulk path, cache keys, interval) per group, built once instead of every cycle
+        self._bulk_polls = tuple(
+            ("/mgmt/bulk?keys=" + ",".join(keys), keys, max(interval or 0, poll_interval))
+            for keys, interval in self.BULK_GROUPS
+        )
+        # Entries outlive cache_ttl by however much longer than a cycle their group waits
+        self._key_ttl = {
+            key: cache_ttl + interval - poll_interval
+            for _, keys, interval in self._bulk_polls
+            for key in keys
+        }
+        # Monotonic time at which each bulk path is next due
+        self._next_due: Dict[str, float] = {}
+        # _invalidation_seq when the current poll cycle started: a refresh only clears
+        # stale marks set before its request went out
+        self._poll_seq = 0
+        # Prepared GET per path: URL parsing and header merging happen once, not per poll
+        self._prepared: Dict[str, requests.PreparedRequest] = {}
+        # Last ETag seen per path, echoed back as If-None-Match
+        self._etags: Dict[str, str] = {}
+        # hash() of the last 200 body per path, to skip decoding identical payloads
+        self._body_hashes: Dict[str, int] = {}
 
     def start(self):
         if self._running:
             return
         self._running = True
+        self._stop_event.clear()
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
         logger.info("MGMT monitor started")
 
     def stop(self):
         self._running = False
+        self._stop_event.set()
         if self._thread:
             self._thread.join(timeout=5)
+        self._executor.shutdown(wait=False)
         self._session.close()
         logger.info("MGMT monitor stopped")
 
     def _monitor_loop(self):
+        # Deadline-based schedule: poll time is absorbed into the interval instead of added to it
+        next_tick = time.monotonic()
         while self._running:
             try:
                 self._poll_all()
             except Exception as exc:
                 logger.warning("Monitor poll failed: %s", exc)
-            time.sleep(self.poll_interval)
+            next_tick += self.poll_interval
+            sleep_for = next_tick - time.monotonic()
+            if sleep_for > 0:
+                self._stop_event.wait(sleep_for)
+            else:
+                # Overran a full interval; resync rather than firing back-to-back polls
+                next_tick = time.monotonic()
+
+    def _prepare(self, path: str) -> requests.PreparedRequest:
+        prepared = self._prepared.get(path)
+        if prepared is None:
+            prepared = self._session.prepare_request(requests.Request("GET", f"{self.mdm_base_url}{path}"))
+            self._prepared[path] = prepared
+        etag = self._etags.get(path)
+        if etag:
+            prepared = prepared.copy()
+            prepared.headers["If-None-Match"] = etag
+        return prepared
 
     def _http_get(self, path: str) -> Optional[Any]:
-        url = f"{self.mdm_base_url}{path}"
-        for attempt in range(self.max_retries):
-            try:
-                response = self._session.get(url, timeout=5)
-                if response.status_code == 200:
-                    return response.json()
-            except Exception:
-                pass
-            if attempt < self.max_retries - 1:
-                time.sleep(self.retry_delay)
-        return None
+        try:
+            response = self._session.send(self._prepare(path), timeout=5)
+        except requests.RequestException as exc:
+            logger.debug("Monitor GET %s failed: %s", path, exc)
+            return None
+        if response.status_code == 304:
+            return _NOT_MODIFIED
+        if response.status_code != 200:
+            logger.debug("Monitor GET %s returned HTTP %s", path, response.status_code)
+            return None
+        body = response.content
+        body_hash = hash(body)
+        if body_hash == self._body_hashes.get(path):
+            return _NOT_MODIFIED
+        try:
+            # Decode the raw bytes directly (skips requests' charset sniffing + str copy)
+            data = json.loads(body)
+        except ValueError:
+            return None
+        self._body_hashes[path] = body_hash
+        new_etag = response.headers.get("ETag")
+        if new_etag:
+            self._etags[path] = new_etag
+        return data
 
     def _put_cache(self, key: str, data: Any):
+        global _cache_version
         with _cache_lock:
+            _cache_version += 1
             _cache_data[key] = data
-            _cache_ts[key] = datetime.utcnow()
+            _cache_data.move_to_end(key)
+            _cache_ts[key] = time.time()
+            _cache_deadline[key] = time.monotonic() + self._key_ttl.get(key, self.cache_ttl)
+            self._clear_stale(key)
+            while len(_cache_data) > MAX_CACHE_KEYS:
+                evicted, _ = _cache_data.popitem(last=False)
+                _cache_ts.pop(evicted, None)
+                _cache_deadline.pop(evicted, None)
+                _stale_keys.pop(evicted, None)
 
-    def _poll_all(self):
-        health = self._http_get("/health")
-        if health is not None:
-            self._put_cache("health_summary", health)
+    def _touch_cache(self, key: str) -> bool:
+        with _cache_lock:
+            if key not in _cache_data:
+                return False
+            _cache_ts[key] = time.time()
+            _cache_deadline[key] = time.monotonic() + self._key_ttl.get(key, self.cache_ttl)
+            # A 304 after a write means MDM's copy did not change: the entry is current again
+            self._clear_stale(key)
+            return True
 
-        components = self._http_get("/health/components")
-        if components is not None:
-            self._put_cache("component_health", components)
+    def _clear_stale(self, key: str):
+        # Caller holds _cache_lock
+        if _stale_keys.get(key, 0) <= self._poll_seq:
+            _stale_keys.pop(key, None)
 
-        metrics = self._http_get("/health/metrics")
-        if metrics is not None:
-            self._put_cache("health_metrics", metrics)
+    def _forget_validators(self, path: str):
+        # Next GET for this path must return a full body
+        self._etags.pop(path, None)
+        self._body_hashes.pop(path, None)
 
-        pools = self._http_get("/pool/list")
-        if pools is not None:
-            self._put_cache("pool_list", pools)
+    def _store(self, key: str, path: str, data: Any):
+        if data is _NOT_MODIFIED:
+            if not self._touch_cache(key):
+                self._forget_validators(path)
+        elif data is not None:
+            self._put_cache(key, data)
 
-        volumes = self._http_get("/vol/list")
-        if volumes is not None:
-            self._put_cache("volume_list", volumes)
+    def _poll_all(self):
+        global _last_poll_ts
+        now = time.monotonic()
+        # Half a cycle of slack so scheduling jitter doesn't push a group to the next tick
+        slack = self.poll_interval / 2
+        with _cache_lock:
+            refresh = set(_refresh_pending)
+            _refresh_pending.clear()
+            self._poll_seq = _invalidation_seq
+        polled = []
+        for bulk_path, keys, interval in self._bulk_polls:
+            if now < self._next_due.get(bulk_path, 0.0) - slack and refresh.isdisjoint(keys):
+                continue
+            self._next_due[bulk_path] = now + interval
+            self._poll_group(bulk_path, keys)
+            polled.extend(keys)
+        with _cache_lock:
+            # Still stale (refresh failed, or invalidated mid-poll): retry on the next tick
+            _refresh_pending.update(key for key in polled if key in _stale_keys)
+        _last_poll_ts = time.time()
+
+    def _poll_group(self, bulk_path: str, keys):
+        # Preferred path: one aggregated GET whose keys match the cache keys
+        snapshot = self._http_get(bulk_path)
+        if snapshot is _NOT_MODIFIED:
+            if not all([self._touch_cache(key) for key in keys]):
+                self._forget_validators(bulk_path)
+            return
+        if isinstance(snapshot, dict):
+            for key, data in snapshot.items():
+                self._store(key, bulk_path, data)
+            return
 
-        topology = self._http_get("/discovery/topology")
-        if topology is not None:
-            self._put_cache("cluster_topology", topology)
+        # Fallback for MDMs without /mgmt/bulk: fan out to the individual endpoints
+        futures = {key: self._executor.submit(self._http_get, self.ENDPOINTS[key]) for key in keys}
+        for key, future in futures.items():
+            self._store(key, self.ENDPOINTS[key], future.result())
@@ -1,43 +1,114 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
 import os
 import atexit
-
-from mgmt.monitor import ComponentMonitor, get_cached_data, get_all_cached_keys
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+from mgmt.monitor import (
+    ComponentMonitor,
+    get_cached_data,
+    get_fresh_cached_data,
+    get_all_cached_keys,
+    get_cache_version,
+    get_last_poll_time,
+    invalidate_cached_data,
+)
 from mgmt.alerts import (
     get_active_alerts,
     get_recent_alerts,
     get_alert_counts,
     acknowledge_alert,
     resolve_alert,
-    format_alert_for_display,
+    format_alerts_for_display,
     get_alert_history_summary,
 )
 
 app = Flask(__name__)
 app.secret_key = 'powerflex-demo-secret'
+app.json.sort_keys = False  # Key order is irrelevant to the dashboard JS; skip the sort on every jsonify
 BASE_URL = str(os.getenv("POWERFLEX_MDM_BASE_URL", "http://127.0.0.1:8001")).strip()
 
+# Full URLs for the fixed MDM paths, joined once at import
+_MDM_URLS = {
+    path: f"{BASE_URL}{path}"
+    for path in (
+        "/pd/list", "/pool/list", "/vol/list", "/sds/list", "/sdc/list",
+        "/cluster/nodes", "/discovery/topology",
+    )
+}
+
+
+def mdm_url(path: str) -> str:
+    return _MDM_URLS.get(path) or f"{BASE_URL}{path}"
+
+
 # Initialize component monitor (starts background thread)
 component_monitor = ComponentMonitor(mdm_base_url=BASE_URL, poll_interval=10, cache_ttl=30)
 component_monitor.start()
 
-# Register cleanup on shutdown
+# Shutdown steps, run once in reverse registration order (like atexit itself)
+_TEARDOWN = [component_monitor.stop]
+
+
 def shutdown_monitor():
-    component_monitor.stop()
+    while _TEARDOWN:
+        step = _TEARDOWN.pop()
+        try:
+            step()
+        except Exception as exc:
+            app.logger.warning("MGMT shutdown step %r failed: %s", step, exc)
 
 atexit.register(shutdown_monitor)
 
 
+def _handle_sigterm(signum, frame):
+    # Docker/systemd stop: unwind the main thread so atexit cleanup runs promptly.
+    # Installed by the launchers only; importers (tests, WSGI servers) keep their own handlers.
+    sys.exit(0)
+
+
+# One pooled keep-alive session for every GUI -> MDM call instead of a new
+# connection per request. Only idempotent methods are retried (urllib3 default),
+# and exhausted retries hand back the last response rather than raising.
+SESSION = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504], raise_on_status=False),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+_TEARDOWN.append(SESSION.close)
+
+# Pages that need several independent MDM lookups issue them concurrently
+EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mgmt-fetch")
+_TEARDOWN.append(lambda: EXECUTOR.shutdown(wait=False))
+
+
 def call_api(method: str, path: str, **kwargs):
-    resp = requests.request(method, f"{BASE_URL}{path}", timeout=10, **kwargs)
-    try:
-        payload = resp.json()
-    except Exception:
+    resp = SESSION.request(method, mdm_url(path), timeout=10, **kwargs)
+    if method != "GET":
+        clear_lookup_cache()
+    ok = 200 <= resp.status_code < 300
+    # Only JSON bodies are parsed; empty (204) and HTML/text error pages go straight to raw
+    payload = None
+    if resp.content and resp.headers.get("content-type", "").startswith("application/json"):
+        try:
+            payload = json.loads(resp.content)
+        except ValueError:
+            pass
+    if payload is None:
         payload = {"raw": resp.text}
 
-    if 200 <= resp.status_code < 300:
+    if ok:
         return True, payload, None
 
     if isinstance(payload, dict):
@@ -47,27 +118,98 @@ def call_api(method: str, path: str, **kwargs):
     return False, payload, f"HTTP {resp.status_code}: {error}"
 
 
-def get_active_cluster_nodes_with_capability(capability: str):
-    ok, payload, _ = call_api("GET", "/cluster/nodes")
+def _get_json(path: str):
+    """GET an MDM path; (True, decoded body) for a 2xx JSON reply, else (False, None)."""
+    try:
+        resp = SESSION.get(mdm_url(path), timeout=10)
+        if not resp.ok:
+            return False, None
+        # json.loads on the raw bytes skips requests' text decoding/charset sniffing
+        return True, json.loads(resp.content)
+    except (requests.RequestException, ValueError):
+        return False, None
+
+
+def fetch_json(path: str):
+    # Unreachable MDM, error status or non-JSON body degrades to an empty list, like call_api callers
+    ok, data = _get_json(path)
+    return data if ok else []
+
+
+# Short-lived cache for lookup lists that several pages fetch on every view.
+# Any write through call_api clears it and marks the monitor's copies of the lists
+# below stale, so the redirect after a change is fresh.
+LOOKUP_TTL = 3.0
+_lookup_cache = {}  # path -> (monotonic deadline, decoded payload)
+_lookup_lock = threading.Lock()
+
+# Lists the component monitor already keeps fresh; pages read them from its cache
+MONITORED_PATHS = {
+    "pool_list": "/pool/list",
+    "volume_list": "/vol/list",
+    "cluster_topology": "/discovery/topology",
+}
+
+
+def cached_fetch_json(path: str):
+    entry = _lookup_cache.get(path)
+    if entry and time.monotonic() < entry[0]:
+        return entry[1]
+    ok, data = _get_json(path)
     if not ok:
+        return []  # Failures are not cached; the next view retries
+    with _lookup_lock:
+        _lookup_cache[path] = (time.monotonic() + LOOKUP_TTL, data)
+    return data
+
+
+def clear_lookup_cache():
+    with _lookup_lock:
+        _lookup_cache.clear()
+    invalidate_cached_data(*MONITORED_PATHS)
+
+
+def monitored_fetch_json(key: str):
+    # Stale monitor entries (a write went through since) are skipped, not served
+    data = get_fresh_cached_data(key)
+    if data is None:
+        data = cached_fetch_json(MONITORED_PATHS[key])
+    return data
+
+
+def fetch_parallel(*calls):
+    """Run (func, *args) lookups on EXECUTOR; results come back in call order."""
+    futures = [EXECUTOR.submit(func, *args) for func, *args in calls]
+    return [future.result() for future in futures]
+
+
+@lru_cache(maxsize=64)
+def _norm_type(value) -> str:
+    # Component types and capabilities are a handful of short strings
+    return str(value).upper()
+
+
+def get_active_cluster_nodes_with_capability(capability: str):
+    payload = cached_fetch_json("/cluster/nodes")
+    # Check the envelope once; MDM serializes every node as an object
+    if not isinstance(payload, dict):
         return []
-    nodes = payload.get("nodes", []) if isinstance(payload, dict) else []
-    cap = capability.upper()
+    cap = _norm_type(capability)
     return [
-        node for node in nodes
-        if isinstance(node, dict) and node.get("status") == "ACTIVE" and cap in [c.upper() for c in node.get("capabilities", [])]
+        node for node in payload.get("nodes", ())
+        if node.get("status") == "ACTIVE"
+        and any(_norm_type(c) == cap for c in node.get("capabilities", ()))
     ]
 
 
 def get_discovered_components_by_type(component_type: str):
-    ok, payload, _ = call_api("GET", "/discovery/topology")
-    if not ok:
+    payload = monitored_fetch_json("cluster_topology")
+    if not isinstance(payload, dict):
         return []
-    components = payload.get("components", []) if isinstance(payload, dict) else []
-    wanted = component_type.upper()
+    wanted = _norm_type(component_type)
     return [
-        comp for comp in components
-        if isinstance(comp, dict) and str(comp.get("component_type", "")).upper() == wanted
+        comp for comp in payload.get("components", ())
+        if _norm_type(comp.get("component_type", "")) == wanted
     ]
 
 @app.route('/')
@@ -78,7 +220,7 @@ def index():
 @app.route('/pd')
 def pd_list():
     try:
-        pds = requests.get(f"{BASE_URL}/pd/list").json()
+        pds = cached_fetch_json("/pd/list")
         return render_template('pd_list.html', pds=pds)
     except Exception as e:
         flash(f"Error fetching PDs: {e}", "danger")
@@ -113,8 +255,7 @@ def pd_delete(pd_id):
 @app.route('/pool')
 def pool_list():
     try:
-        pools = requests.get(f"{BASE_URL}/pool/list").json()
-        pds = requests.get(f"{BASE_URL}/pd/list").json()
+        pools, pds = fetch_parallel((monitored_fetch_json, "pool_list"), (cached_fetch_json, "/pd/list"))
         return render_template('pool_list.html', pools=pools, pds=pds)
     except Exception as e:
         flash(f"Error fetching pools: {e}", "danger")
@@ -147,7 +288,7 @@ def pool_create():
 @app.route('/pool/<int:pool_id>/health')
 def pool_health(pool_id):
     try:
-        health = requests.get(f"{BASE_URL}/pool/{pool_id}/health").json()
+        health = fetch_json(f"/pool/{pool_id}/health")
         return jsonify(health)
     except Exception as e:
         return jsonify({"error": str(e)})
@@ -156,10 +297,12 @@ def pool_health(pool_id):
 @app.route('/sds')
 def sds_list():
     try:
-        sds_nodes = requests.get(f"{BASE_URL}/sds/list").json()
-        pds = requests.get(f"{BASE_URL}/pd/list").json()
-        sds_capable_nodes = get_active_cluster_nodes_with_capability("SDS")
-        discovered_sds_nodes = get_discovered_components_by_type("SDS")
+        sds_nodes, pds, sds_capable_nodes, discovered_sds_nodes = fetch_parallel(
+            (fetch_json, "/sds/list"),
+            (cached_fetch_json, "/pd/list"),
+            (get_active_cluster_nodes_with_capability, "SDS"),
+            (get_discovered_components_by_type, "SDS"),
+        )
         if isinstance(sds_nodes, list) and len(sds_nodes) == 0 and len(discovered_sds_nodes) > 0:
             flash(
                 "SDS services are discovered by MDM, but SDS entities are not yet registered. "
@@ -231,9 +374,11 @@ def sds_recover(sds_id):
 @app.route('/sdc')
 def sdc_list():
     try:
-        sdcs = requests.get(f"{BASE_URL}/sdc/list").json()
-        sdc_capable_nodes = get_active_cluster_nodes_with_capability("SDC")
-        discovered_sdcs = get_discovered_components_by_type("SDC")
+        sdcs, sdc_capable_nodes, discovered_sdcs = fetch_parallel(
+            (fetch_json, "/sdc/list"),
+            (get_active_cluster_nodes_with_capability, "SDC"),
+            (get_discovered_components_by_type, "SDC"),
+        )
         if isinstance(sdcs, list) and len(sdcs) == 0 and len(discovered_sdcs) > 0:
             flash(
                 "SDC services are discovered by MDM, but SDC entities are not yet registered. "
@@ -263,10 +408,12 @@ def sdc_add():
 @app.route('/volume')
 def volume_list():
     try:
-        volumes = requests.get(f"{BASE_URL}/vol/list").json()
-        pools = requests.get(f"{BASE_URL}/pool/list").json()
-        sdcs = requests.get(f"{BASE_URL}/sdc/list").json()
-        discovered_sdcs = get_discovered_components_by_type("SDC")
+        volumes, pools, sdcs, discovered_sdcs = fetch_parallel(
+            (monitored_fetch_json, "volume_list"),
+            (monitored_fetch_json, "pool_list"),
+            (fetch_json, "/sdc/list"),
+            (get_discovered_components_by_type, "SDC"),
+        )
         if isinstance(sdcs, list) and len(sdcs) == 0 and len(discovered_sdcs) > 0:
             flash("No SDC entities found for volume mapping. Add SDC clients first from the SDC page.", "warning")
         return render_template('volume_list.html', volumes=volumes, pools=pools, sdcs=sdcs)
@@ -385,9 +532,11 @@ def volume_io_read(vol_id):
 @app.route('/metrics')
 def metrics():
     try:
-        pools = requests.get(f"{BASE_URL}/pool/list").json()
-        volumes = requests.get(f"{BASE_URL}/vol/list").json()
-        sds_nodes = requests.get(f"{BASE_URL}/sds/list").json()
+        pools, volumes, sds_nodes = fetch_parallel(
+            (monitored_fetch_json, "pool_list"),
+            (monitored_fetch_json, "volume_list"),
+            (fetch_json, "/sds/list"),
+        )
         return render_template('metrics.html', pools=pools, volumes=volumes, sds_nodes=sds_nodes)
     except Exception as e:
         flash(f"Error fetching metrics: {e}", "danger")
@@ -396,7 +545,7 @@ def metrics():
 @app.route('/metrics/pool/<int:pool_id>')
 def metrics_pool(pool_id):
     try:
-        metrics = requests.get(f"{BASE_URL}/metrics/pool/{pool_id}").json()
+        metrics = fetch_json(f"/metrics/pool/{pool_id}")
         return jsonify(metrics)
     except Exception as e:
         return jsonify({"error": str(e)})
@@ -404,7 +553,7 @@ def metrics_pool(pool_id):
 @app.route('/metrics/volume/<int:vol_id>')
 def metrics_volume(vol_id):
     try:
-        metrics = requests.get(f"{BASE_URL}/metrics/volume/{vol_id}").json()
+        metrics = fetch_json(f"/metrics/volume/{vol_id}")
         return jsonify(metrics)
     except Exception as e:
         return jsonify({"error": str(e)})
@@ -412,7 +561,7 @@ def metrics_volume(vol_id):
 @app.route('/metrics/sds/<int:sds_id>')
 def metrics_sds(sds_id):
     try:
-        metrics = requests.get(f"{BASE_URL}/metrics/sds/{sds_id}").json()
+        metrics = fetch_json(f"/metrics/sds/{sds_id}")
         return jsonify(metrics)
     except Exception as e:
         return jsonify({"error": str(e)})
@@ -421,7 +570,7 @@ def metrics_sds(sds_id):
 @app.route('/rebuild')
 def rebuild():
     try:
-        pools = requests.get(f"{BASE_URL}/pool/list").json()
+        pools = monitored_fetch_json("pool_list")
         return render_template('rebuild.html', pools=pools)
     except Exception as e:
         flash(f"Error fetching pools: {e}", "danger")
@@ -442,7 +591,7 @@ def rebuild_start(pool_id):
 @app.route('/rebuild/<int:pool_id>/status')
 def rebuild_status(pool_id):
     try:
-        status = requests.get(f"{BASE_URL}/rebuild/status/{pool_id}").json()
+        status = fetch_json(f"/rebuild/status/{pool_id}")
         return jsonify(status)
     except Exception as e:
         return jsonify({"error": str(e)})
@@ -462,11 +611,44 @@ def bootstrap_minimal_cluster():
         flash(f"Bootstrap failed: {e}", "danger")
     return redirect(url_for('index'))
 
+# Fallback context for pages whose alert queries failed (read-only, shared)
+EMPTY_ALERT_COUNTS = {"total": 0, "critical": 0, "error": 0, "warning": 0, "info": 0}
+EMPTY_ALERT_HISTORY = {"total_alerts": 0, "resolved": 0}
+
+
+def conditional_json(payload):
+    """jsonify with an ETag; a matching If-None-Match gets an empty 304."""
+    response = jsonify(payload)
+    response.add_etag()
+    # Revalidate on every poll: monitor data moves every cycle, 304 keeps it cheap
+    response.headers["Cache-Control"] = "no-cache"
+    return response.make_conditional(request)
+
+# Rendered HTML for monitor-driven pages: name -> (monitor cache version, monotonic deadline, html).
+# Reused until the monitor data changes or one poll interval passes (alert ages, DB-side alerts).
+_page_cache = {}
+
+
+def get_cached_page(name: str):
+    entry = _page_cache.get(name)
+    if entry and entry[0] == get_cache_version() and time.monotonic() < entry[1] and "_flashes" not in session:
+        return entry[2]
+    return None
+
+
+def put_cached_page(name: str, version: int, html: str):
+    _page_cache[name] = (version, time.monotonic() + component_monitor.poll_interval, html)
+
+
 # Health Dashboard Routes
 @app.route('/health')
 def health_dashboard():
     """Health dashboard page (HTML)."""
+    cached = get_cached_page("health")
+    if cached is not None:
+        return cached
     try:
+        version = get_cache_version()
         # Get cached health data
         health_summary = get_cached_data("health_summary") or {}
         health_metrics = get_cached_data("health_metrics") or {}
@@ -493,9 +675,11 @@ def health_dashboard():
                 components_by_type[comp_type].append(comp)
         
         # Format alerts for display
-        active_display = [format_alert_for_display(a) for a in active_alerts]
+        active_display = format_alerts_for_display(active_alerts)
         
-        return render_template(
+        # Flash messages are consumed by the render; such pages are one-offs
+        had_flashes = "_flashes" in session
+        html = render_template(
             'health_dashboard.html',
             health_summary=health_summary,
             health_metrics=health_metrics,
@@ -503,17 +687,35 @@ def health_dashboard():
             active_alerts=active_display,
             components_by_type=components_by_type
         )
+        if not had_flashes:
+            put_cached_page("health", version, html)
+        return html
     except Exception as e:
         flash(f"Error loading health dashboard: {e}", "danger")
         return render_template(
             'health_dashboard.html',
             health_summary={},
             health_metrics={},
-            alert_counts={"total": 0, "critical": 0, "error": 0, "warning": 0, "info": 0},
+            alert_counts=EMPTY_ALERT_COUNTS,
             active_alerts=[],
             components_by_type={}
         )
 
+def summarize_pools(pool_list):
+    """Pool count and capacity totals in a single pass over the cached list."""
+    if not isinstance(pool_list, list):
+        return {"total": 0, "total_capacity_gb": 0, "available_capacity_gb": 0}
+    total_capacity = available_capacity = 0
+    for pool in pool_list:
+        if isinstance(pool, dict):
+            total_capacity += pool.get("total_capacity_gb", 0)
+            available_capacity += pool.get("available_capacity_gb", 0)
+    return {
+        "total": len(pool_list),
+        "total_capacity_gb": total_capacity,
+        "available_capacity_gb": available_capacity,
+    }
+
 @app.route('/health/api/summary')
 def health_api_summary():
     """Health dashboard data API (JSON)."""
@@ -534,17 +736,14 @@ def health_api_summary():
             "health_metrics": health_metrics if isinstance(health_metrics, dict) else {},
             "alert_counts": alert_counts if isinstance(alert_counts, dict) else {},
             "component_health": component_health_data,
-            "pools": {
-                "total": len(pool_list) if isinstance(pool_list, list) else 0,
-                "total_capacity_gb": sum(p.get("total_capacity_gb", 0) for p in pool_list if isinstance(p, dict)) if isinstance(pool_list, list) else 0,
-                "available_capacity_gb": sum(p.get("available_capacity_gb", 0) for p in pool_list if isinstance(p, dict)) if isinstance(pool_list, list) else 0,
-            },
+            "pools": summarize_pools(pool_list),
             "volumes": {
                 "total": len(volume_list) if isinstance(volume_list, list) else 0,
-            }
+            },
+            "last_poll_ts": get_last_poll_time(),
         }
         
-        return jsonify(summary)
+        return conditional_json(summary)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -564,7 +763,7 @@ def health_api_components():
             components = component_health_data
         
         # Test expects a direct list, not a dict wrapper
-        return jsonify(components)
+        return conditional_json(components)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -580,8 +779,8 @@ def alerts_list():
         alert_history = get_alert_history_summary(hours=24)
         
         # Format alerts for display
-        active_display = [format_alert_for_display(a) for a in active_alerts]
-        recent_display = [format_alert_for_display(a) for a in recent_alerts]
+        active_display = format_alerts_for_display(active_alerts)
+        recent_display = format_alerts_for_display(recent_alerts)
         
         return render_template(
             'alerts_list.html',
@@ -596,8 +795,8 @@ def alerts_list():
             'alerts_list.html',
             active_alerts=[],
             recent_alerts=[],
-            alert_counts={"total": 0, "critical": 0, "error": 0, "warning": 0, "info": 0},
-            alert_history={"total_alerts": 0, "resolved": 0}
+            alert_counts=EMPTY_ALERT_COUNTS,
+            alert_history=EMPTY_ALERT_HISTORY
         )
 
 @app.route('/alerts/acknowledge/<int:alert_id>', methods=['POST'])
@@ -606,6 +805,7 @@ def alert_acknowledge(alert_id):
     try:
         username = request.form.get('username', 'admin')
         success = acknowledge_alert(alert_id, username)
+        _page_cache.clear()
         if success:
             flash(f"Alert {alert_id} acknowledged", "success")
         else:
@@ -620,6 +820,7 @@ def alert_resolve(alert_id):
     try:
         username = request.form.get('username', 'admin')
         success = resolve_alert(alert_id, username)
+        _page_cache.clear()
         if success:
             flash(f"Alert {alert_id} resolved", "success")
         else:
@@ -632,4 +833,5 @@ if __name__ == '__main__':
     host = str(os.getenv("POWERFLEX_GUI_BIND_HOST", "0.0.0.0")).strip()
     port = int(str(os.getenv("POWERFLEX_GUI_PORT", "5000")).strip())
     debug = str(os.getenv("POWERFLEX_GUI_DEBUG", "false")).strip().lower() in {"1", "true", "yes"}
+    signal.signal(signal.SIGTERM, _handle_sigterm)
     app.run(host=host, port=port, debug=debug)
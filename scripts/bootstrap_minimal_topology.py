@@ -1,21 +1,22 @@
 import argparse
 import json
-from urllib import request
+
+import requests
+
+# Both calls go to the same MDM; the second reuses the first one's connection
+SESSION = requests.Session()
 
 
 def post_json(url: str, payload: dict) -> tuple[int, dict]:
-    body = json.dumps(payload).encode("utf-8")
-    req = request.Request(url, data=body, headers={"Content-Type": "application/json"}, method="POST")
-    with request.urlopen(req, timeout=10) as resp:
-        data = resp.read().decode("utf-8")
-        return resp.status, json.loads(data)
+    resp = SESSION.post(url, json=payload, timeout=10)
+    resp.raise_for_status()
+    return resp.status_code, resp.json()
 
 
 def get_json(url: str) -> tuple[int, dict]:
-    req = request.Request(url, method="GET")
-    with request.urlopen(req, timeout=10) as resp:
-        data = resp.read().decode("utf-8")
-        return resp.status, json.loads(data)
+    resp = SESSION.get(url, timeout=10)
+    resp.raise_for_status()
+    return resp.status_code, resp.json()
 
 
 def main() -> None:
@@ -45,6 +46,7 @@ def main() -> None:
     code, summary = get_json(f"{args.base_url}/cluster/summary")
     print(f"GET /cluster/summary -> {code}")
     print(json.dumps(summary, indent=2))
+    SESSION.close()
 
 
 if __name__ == "__main__":
@@ -27,7 +27,10 @@ POWERFLEX_GUI_BIND_HOST: Flask bind address (default: 0.0.0.0)
 POWERFLEX_GUI_DEBUG: Enable Flask debug mode (default: false)
 """
 
+import atexit
+import logging
 import os
+import signal
 import sys
 from pathlib import Path
 
@@ -35,59 +38,87 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from mgmt.database import init_db as init_mgmt_database
+from mgmt.database import init_db as init_mgmt_database, optimize_db as optimize_mgmt_database
 from mgmt.service import app
 
+_DEBUG_TRUE = frozenset({"true", "1", "yes"})
+
+
+def emit(text: str):
+    """Write a block of lines to stdout in a single write."""
+    sys.stdout.write(text + "\n")
+    sys.stdout.flush()
+
+
+def handle_sigterm(signum, frame):
+    """Docker/systemd stop: unwind the main thread so atexit cleanup runs promptly."""
+    sys.exit(0)
+
 
 def main():
     """Main entrypoint for MGMT service."""
     
-    print("=" * 60)
-    print("PowerFlex Management GUI Service")
-    print("=" * 60)
-    
     # Configuration
     mdm_base_url = os.getenv("POWERFLEX_MDM_BASE_URL", "http://127.0.0.1:8001")
     bind_host = os.getenv("POWERFLEX_GUI_BIND_HOST", "0.0.0.0")
     port = int(os.getenv("POWERFLEX_GUI_PORT", "5000"))
-    debug = os.getenv("POWERFLEX_GUI_DEBUG", "false").lower() in {"true", "1", "yes"}
+    debug = os.getenv("POWERFLEX_GUI_DEBUG", "false").lower() in _DEBUG_TRUE
     
-    print(f"MDM API: {mdm_base_url}")
-    print(f"Bind Address: {bind_host}:{port}")
-    print(f"Debug Mode: {debug}")
-    
-    # Initialize database
-    print("\nInitializing MGMT database...")
+    # Banners are built as one string and written once (one stdout write per block)
+    emit("\n".join([
+        "=" * 60,
+        "PowerFlex Management GUI Service",
+        "=" * 60,
+        f"MDM API: {mdm_base_url}",
+        f"Bind Address: {bind_host}:{port}",
+        f"Debug Mode: {debug}",
+        "",
+        "Initializing MGMT database...",
+    ]))
     try:
-        init_mgmt_database()
-        print("✓ MGMT database ready (mgmt.db)")
+        journal_mode = init_mgmt_database()
+        atexit.register(optimize_mgmt_database)
+        journal = f", journal_mode={journal_mode}" if journal_mode else ""
+        print(f"✓ MGMT database ready (mgmt.db{journal})")
     except Exception as e:
         print(f"✗ Database initialization failed: {e}")
         return 1
     
     # Component monitor is initialized automatically in service.py
-    print("✓ Component monitor started (background thread)")
-    print("  - Polling interval: 10 seconds")
-    print("  - Cache TTL: 30 seconds")
-    
-    print("\n" + "=" * 60)
-    print(f"MGMT GUI available at: http://{bind_host}:{port}")
-    print("=" * 60)
-    print("\nEndpoints:")
-    print(f"  • Health Dashboard: http://{bind_host}:{port}/health")
-    print(f"  • Alerts: http://{bind_host}:{port}/alerts")
-    print(f"  • Volumes: http://{bind_host}:{port}/volume")
-    print(f"  • Pools: http://{bind_host}:{port}/pool")
-    print(f"  • SDS Nodes: http://{bind_host}:{port}/sds")
-    print(f"  • SDC Nodes: http://{bind_host}:{port}/sdc")
-    print(f"  • Metrics: http://{bind_host}:{port}/metrics")
+    gui_url = f"http://{bind_host}:{port}"
+    emit("\n".join([
+        "✓ Component monitor started (background thread)",
+        "  - Polling interval: 10 seconds",
+        "  - Cache TTL: 30 seconds",
+        "",
+        "=" * 60,
+        f"MGMT GUI available at: {gui_url}",
+        "=" * 60,
+        "",
+        "Endpoints:",
+        f"  • Health Dashboard: {gui_url}/health",
+        f"  • Alerts: {gui_url}/alerts",
+        f"  • Volumes: {gui_url}/volume",
+        f"  • Pools: {gui_url}/pool",
+        f"  • SDS Nodes: {gui_url}/sds",
+        f"  • SDC Nodes: {gui_url}/sdc",
+        f"  • Metrics: {gui_url}/metrics",
+        "",
+        "Monitoring:",
+        "  • Health data cached from MDM (auto-refresh every 10s)",
+        "  • Alerts generated for component failures",
+        "  • Dashboard auto-refreshes every 10s",
+        "",
+        "Press Ctrl+C to stop",
+        "",
+    ]))
     
-    print("\nMonitoring:")
-    print("  • Health data cached from MDM (auto-refresh every 10s)")
-    print("  • Alerts generated for component failures")
-    print("  • Dashboard auto-refreshes every 10s")
+    # Per-request access lines take the logging lock and format a string on every
+    # dashboard/metrics poll; keep them only in debug mode
+    if not debug:
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
     
-    print("\nPress Ctrl+C to stop\n")
+    signal.signal(signal.SIGTERM, handle_sigterm)
     
     try:
         # Start Flask app
@@ -25,20 +25,58 @@ import os
 import logging
 import argparse
 import hashlib
+import ipaddress
+import json
+import socket
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlsplit
 from pathlib import Path
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from sdc.service import SDCService
-
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
 logger = logging.getLogger(__name__)
+# Format strings use no thread/process fields; skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Environment-derived defaults, read once at import
+DEFAULT_SDC_ID = int(os.getenv("POWERFLEX_SDC_ID", "1"))
+DEFAULT_SDC_ADDRESS = os.getenv("POWERFLEX_SDC_ADDRESS", "127.0.0.1")
+DEFAULT_MDM_ADDRESS = os.getenv("POWERFLEX_MDM_ADDRESS", "127.0.0.1")
+DEFAULT_MDM_PORT = int(os.getenv("POWERFLEX_MDM_PORT", "8001"))
+DEFAULT_CLUSTER_SECRET = os.getenv("POWERFLEX_CLUSTER_SECRET")
+
+class _PinnedHostAdapter(HTTPAdapter):
+    """HTTPAdapter that restores the original Host header on requests sent to a pinned MDM IP."""
+
+    def __init__(self, *args, **kwargs):
+        self.pinned_hosts = {}  # "ip:port" netloc -> original "host:port"
+        super().__init__(*args, **kwargs)
+
+    def add_headers(self, request, **kwargs):
+        original = self.pinned_hosts.get(urlsplit(request.url).netloc)
+        if original:
+            request.headers["Host"] = original
+
+
+# Keep-alive session shared by registration and the service's heartbeat loop
+_MDM_ADAPTER = _PinnedHostAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+_MDM_SESSION = requests.Session()
+_MDM_SESSION.mount("http://", _MDM_ADAPTER)
+_MDM_SESSION.headers.update({"User-Agent": "powerflex-sdc/0.6", "Connection": "keep-alive"})
 
 
 def register_with_mdm(
@@ -49,20 +87,16 @@ def register_with_mdm(
     mgmt_port: int,
     mdm_address: str,
     mdm_port: int,
-    cluster_secret: str = None
+    auth_token: str = None
 ) -> dict:
     """
     Register SDC with MDM discovery API.
     
+    auth_token (see compute_auth_token) is required for re-registration.
     Returns MDM response with cluster_secret on first registration.
     """
     register_url = f"http://{mdm_address}:{mdm_port}/discovery/register"
     
-    # Compute auth token (for re-registration)
-    auth_token = None
-    if cluster_secret:
-        auth_token = hashlib.sha256(f"{cluster_secret}{component_id}".encode()).hexdigest()
-    
     payload = {
         "component_id": component_id,
         "component_type": "SDC",
@@ -80,25 +114,55 @@ def register_with_mdm(
         payload["auth_token"] = auth_token
     
     try:
-        response = requests.post(register_url, json=payload, timeout=10)
+        response = _MDM_SESSION.post(register_url, json=payload, timeout=10)
         response.raise_for_status()
-        return response.json()
+        return json.loads(response.content)
     
     except requests.exceptions.RequestException as e:
-        logger.error(f"Registration failed: {e}")
+        logger.error("Registration failed: %s", e)
         raise
 
 
+def resolve_mdm_address(mdm_address: str, mdm_port: int) -> str:
+    """
+    Resolve the MDM hostname once and pin the IP for this process.
+    Requests to the pinned IP carry the original Host header; IP literals and
+    lookup failures keep the address as given.
+    """
+    try:
+        ipaddress.ip_address(mdm_address)
+        return mdm_address
+    except ValueError:
+        pass
+    try:
+        mdm_ip = socket.gethostbyname(mdm_address)
+    except OSError as e:
+        logger.warning("Could not resolve MDM address %s: %s", mdm_address, e)
+        return mdm_address
+    _MDM_ADAPTER.pinned_hosts[f"{mdm_ip}:{mdm_port}"] = f"{mdm_address}:{mdm_port}"
+    logger.info("Resolved MDM %s -> %s", mdm_address, mdm_ip)
+    return mdm_ip
+
+
+def compute_auth_token(cluster_secret: str, component_id: str) -> str:
+    """SHA256(cluster_secret + component_id), as verified by MDM discovery."""
+    # Feeding both parts into one digest equals hashing the concatenation, without building it.
+    # (Not HMAC: MDM verifies the plain SHA256 construction.)
+    digest = hashlib.sha256(cluster_secret.encode())
+    digest.update(component_id.encode())
+    return digest.hexdigest()
+
+
 def main():
     parser = argparse.ArgumentParser(description="Launch SDC service")
-    parser.add_argument("--sdc-id", type=int, default=int(os.getenv("POWERFLEX_SDC_ID", "1")), help="SDC ID")
-    parser.add_argument("--address", default=os.getenv("POWERFLEX_SDC_ADDRESS", "127.0.0.1"), help="Listen address")
+    parser.add_argument("--sdc-id", type=int, default=DEFAULT_SDC_ID, help="SDC ID")
+    parser.add_argument("--address", default=DEFAULT_SDC_ADDRESS, help="Listen address")
     parser.add_argument("--nbd-port", type=int, default=8005, help="NBD server port")
     parser.add_argument("--control-port", type=int, default=8003, help="Control API port")
     parser.add_argument("--mgmt-port", type=int, default=8004, help="Management API port")
-    parser.add_argument("--mdm-address", default=os.getenv("POWERFLEX_MDM_ADDRESS", "127.0.0.1"), help="MDM address")
-    parser.add_argument("--mdm-port", type=int, default=int(os.getenv("POWERFLEX_MDM_PORT", "8001")), help="MDM port")
-    parser.add_argument("--cluster-secret", default=os.getenv("POWERFLEX_CLUSTER_SECRET"), help="Cluster secret")
+    parser.add_argument("--mdm-address", default=DEFAULT_MDM_ADDRESS, help="MDM address")
+    parser.add_argument("--mdm-port", type=int, default=DEFAULT_MDM_PORT, help="MDM port")
+    parser.add_argument("--cluster-secret", default=DEFAULT_CLUSTER_SECRET, help="Cluster secret")
     parser.add_argument("--no-register", action="store_true", help="Skip MDM registration")
     
     args = parser.parse_args()
@@ -106,16 +170,20 @@ def main():
     # Generate component ID
     component_id = f"sdc-{args.address}-{args.nbd_port}"
     
-    logger.info(f"Starting SDC service: {component_id}")
-    logger.info(f"  SDC ID: {args.sdc_id}")
-    logger.info(f"  Listen address: {args.address}")
-    logger.info(f"  NBD port: {args.nbd_port}")
-    logger.info(f"  Control port: {args.control_port}")
-    logger.info(f"  Mgmt port: {args.mgmt_port}")
-    logger.info(f"  MDM: {args.mdm_address}:{args.mdm_port}")
+    # One record for the whole startup banner: one lock, one format, one write
+    logger.info(
+        "Starting SDC service %s id=%s listen=%s nbd=%s control=%s mgmt=%s mdm=%s:%s",
+        component_id, args.sdc_id, args.address, args.nbd_port,
+        args.control_port, args.mgmt_port, args.mdm_address, args.mdm_port,
+        extra={"sdc_id": args.sdc_id, "component_id": component_id, "nbd_port": args.nbd_port},
+    )
+    
+    mdm_address = resolve_mdm_address(args.mdm_address, args.mdm_port)
     
     # Register with MDM (unless --no-register)
     cluster_secret = args.cluster_secret
+    # Token depends only on secret + component ID: compute once per process
+    auth_token = compute_auth_token(cluster_secret, component_id) if cluster_secret else None
     
     if not args.no_register:
         try:
@@ -127,12 +195,12 @@ def main():
                 control_port=args.control_port,
                 data_port=args.nbd_port,
                 mgmt_port=args.mgmt_port,
-                mdm_address=args.mdm_address,
+                mdm_address=mdm_address,
                 mdm_port=args.mdm_port,
-                cluster_secret=cluster_secret
+                auth_token=auth_token
             )
             
-            logger.info(f"Registration status: {reg_response.get('status')}")
+            logger.info("Registration status: %s", reg_response.get("status"))
             
             # Store cluster secret if first-time registration
             if reg_response.get("cluster_secret"):
@@ -140,10 +208,12 @@ def main():
                 logger.info("Received cluster secret from MDM (store securely)")
         
         except Exception as e:
-            logger.error(f"Registration failed: {e}")
+            logger.error("Registration failed: %s", e)
             logger.warning("Continuing without registration (may affect IO operations)")
     
-    # Create and start SDC service
+    # Create and start SDC service (imported here so --help and bad args skip the service stack)
+    from sdc.service import SDCService
+    
     service = SDCService(
         sdc_id=args.sdc_id,
         sdc_component_id=component_id,
@@ -151,9 +221,10 @@ def main():
         nbd_port=args.nbd_port,
         control_port=args.control_port,
         mgmt_port=args.mgmt_port,
-        mdm_address=args.mdm_address,
+        mdm_address=mdm_address,
         mdm_port=args.mdm_port,
-        cluster_secret=cluster_secret
+        cluster_secret=cluster_secret,
+        http_session=_MDM_SESSION
     )
     
     try:
@@ -12,24 +12,57 @@ Environment variables:
 """
 
 import argparse
+import ipaddress
+import json
 import os
+import socket
 import sys
+from urllib.parse import urlsplit, urlunsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
 import signal
-import time
 
 # Add project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
-from sds.service import SDSService
-
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 )
 logger = logging.getLogger(__name__)
+# Format strings use no thread/process fields; skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+# Environment-derived defaults, read once at import
+DEFAULT_MDM_URL = os.getenv("MDM_URL", "http://127.0.0.1:8001")
+
+class _PinnedHostAdapter(HTTPAdapter):
+    """HTTPAdapter that restores the original Host header on requests sent to a pinned MDM IP."""
+
+    def __init__(self, *args, **kwargs):
+        self.pinned_hosts = {}  # "ip:port" netloc -> original "host:port"
+        super().__init__(*args, **kwargs)
+
+    def add_headers(self, request, **kwargs):
+        original = self.pinned_hosts.get(urlsplit(request.url).netloc)
+        if original:
+            request.headers["Host"] = original
+
+
+# Keep-alive session shared by registration and the service's heartbeat/ACK senders
+_MDM_ADAPTER = _PinnedHostAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504]),
+)
+_MDM_SESSION = requests.Session()
+_MDM_SESSION.mount("http://", _MDM_ADAPTER)
+_MDM_SESSION.headers.update({"User-Agent": "powerflex-sds/1.0", "Connection": "keep-alive"})
 
 
 def register_with_mdm(mdm_url: str, sds_ip: str, data_port: int, control_port: int, mgmt_port: int) -> dict:
@@ -56,28 +89,54 @@ def register_with_mdm(mdm_url: str, sds_ip: str, data_port: int, control_port: i
         }
     }
     
-    logger.info(f"Registering SDS with MDM: {mdm_url}/discovery/register")
+    logger.info("Registering SDS with MDM: %s/discovery/register", mdm_url)
     
     try:
-        response = requests.post(
+        response = _MDM_SESSION.post(
             f"{mdm_url}/discovery/register",
             json=payload,
             timeout=10
         )
         
         if response.status_code in (200, 201):
-            result = response.json()
-            logger.info(f"✓ Registration successful: component_id={result['component_id']}")
+            result = json.loads(response.content)
+            logger.info("✓ Registration successful: component_id=%s", result["component_id"])
             return result
         else:
-            logger.error(f"Registration failed: status={response.status_code}, body={response.text}")
+            logger.error("Registration failed: status=%s, body=%s", response.status_code, response.text)
             sys.exit(1)
     
     except requests.exceptions.RequestException as e:
-        logger.error(f"Registration request failed: {e}")
+        logger.error("Registration request failed: %s", e)
         sys.exit(1)
 
 
+def resolve_mdm_url(mdm_url: str) -> str:
+    """
+    Resolve the MDM hostname once and pin the IP into the URL for this process.
+    Requests to the pinned IP carry the original Host header. https URLs (the
+    certificate names the host), IP literals and lookup failures keep the URL.
+    """
+    parts = urlsplit(mdm_url)
+    host = parts.hostname
+    if parts.scheme != "http" or not host:
+        return mdm_url
+    try:
+        ipaddress.ip_address(host)
+        return mdm_url
+    except ValueError:
+        pass
+    try:
+        mdm_ip = socket.gethostbyname(host)
+    except OSError as e:
+        logger.warning("Could not resolve MDM host %s: %s", host, e)
+        return mdm_url
+    netloc = mdm_ip if parts.port is None else f"{mdm_ip}:{parts.port}"
+    _MDM_ADAPTER.pinned_hosts[netloc] = parts.netloc
+    logger.info("Resolved MDM %s -> %s", host, mdm_ip)
+    return urlunsplit(parts._replace(netloc=netloc))
+
+
 def main():
     parser = argparse.ArgumentParser(description="Launch PowerFlex SDS Service")
     
@@ -102,7 +161,7 @@ def main():
     parser.add_argument(
         "--mdm-url",
         type=str,
-        default=os.getenv("MDM_URL", "http://127.0.0.1:8001"),
+        default=DEFAULT_MDM_URL,
         help="MDM URL (default: http://127.0.0.1:8001 or $MDM_URL)"
     )
     parser.add_argument(
@@ -144,10 +203,15 @@ def main():
     
     args = parser.parse_args()
     
+    # Imported after argparse so --help and bad args skip the service stack
+    from sds.service import SDSService
+    
+    mdm_url = resolve_mdm_url(args.mdm_url)
+    
     # 1. Register with MDM to get cluster_secret
     logger.info("Step 1: Registering with MDM...")
     registration = register_with_mdm(
-        mdm_url=args.mdm_url,
+        mdm_url=mdm_url,
         sds_ip=args.sds_ip,
         data_port=args.data_port,
         control_port=args.control_port,
@@ -163,18 +227,19 @@ def main():
         sds_id=args.sds_id,
         component_id=component_id,
         storage_root=args.storage_root,
-        mdm_url=args.mdm_url,
+        mdm_url=mdm_url,
         cluster_secret=cluster_secret,
         data_host=args.data_host,
         data_port=args.data_port,
         control_host=args.control_host,
         control_port=args.control_port,
         mgmt_host=args.mgmt_host,
-        mgmt_port=args.mgmt_port
+        mgmt_port=args.mgmt_port,
+        http_session=_MDM_SESSION
     )
     
     def signal_handler(signum, frame):
-        logger.info(f"\nReceived signal {signum}, shutting down...")
+        logger.info("\nReceived signal %s, shutting down...", signum)
         service.stop()
         sys.exit(0)
     
@@ -183,10 +248,11 @@ def main():
     
     service.start()
     
-    # Keep alive
+    # Keep alive, parked on the stop event (no periodic wakeups).
+    # Windows can't interrupt an untimed wait with Ctrl+C, so it polls instead.
     try:
-        while service.running.is_set():
-            time.sleep(1)
+        while not service.stopped.wait(None if os.name == "posix" else 1.0):
+            pass
     except KeyboardInterrupt:
         logger.info("\nKeyboard interrupt, shutting down...")
         service.stop()
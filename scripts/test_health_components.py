@@ -1,19 +1,37 @@
 """Test /health/components endpoint"""
+import argparse
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import time
 import traceback
 
-try:
-    r = requests.get('http://127.0.0.1:8001/health/components', timeout=5)
-    print(f'Status: {r.status_code}')
-    
-    if r.status_code == 200:
-        data = r.json()
-        print(json.dumps(data, indent=2))
-    else:
-        print(f'Error response:')
-        print(r.text[:1000])
-        
-except Exception as e:
-    print(f'Exception: {e}')
-    traceback.print_exc()
+parser = argparse.ArgumentParser(description="Probe MDM /health/components")
+parser.add_argument('--url', default='http://127.0.0.1:8001/health/components', help='Endpoint to probe')
+parser.add_argument('--loop', type=int, default=1, help='Number of probes (reuse one connection)')
+parser.add_argument('--interval', type=float, default=0.0, help='Seconds between probes')
+args = parser.parse_args()
+
+# One keep-alive session: repeated probes skip the TCP handshake
+session = requests.Session()
+session.mount('http://', HTTPAdapter(pool_maxsize=8))
+
+for i in range(args.loop):
+    if i:
+        time.sleep(args.interval)
+    try:
+        r = session.get(args.url, timeout=5)
+        print(f'Status: {r.status_code}')
+
+        if r.status_code == 200:
+            data = r.json()
+            print(json.dumps(data, indent=2))
+        else:
+            print(f'Error response:')
+            print(r.text[:1000])
+
+    except Exception as e:
+        print(f'Exception: {e}')
+        traceback.print_exc()
+
+session.close()
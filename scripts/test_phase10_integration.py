@@ -23,23 +23,30 @@ Usage:
 import sys
 import os
 import time
+import threading
 import json
-import base64
+from binascii import a2b_base64, b2a_base64
 import argparse
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 
 # Fix Windows console encoding for Unicode output
+# (reconfigure the existing streams rather than wrapping them in a codecs writer)
 if sys.platform == 'win32':
-    import codecs
-    sys.stdout = codecs.getwriter('utf-8')(sys.stdout.buffer, 'strict')
-    sys.stderr = codecs.getwriter('utf-8')(sys.stderr.buffer, 'strict')
+    sys.stdout.reconfigure(encoding='utf-8', errors='strict')
+    sys.stderr.reconfigure(encoding='utf-8', errors='strict')
 
 # Test configuration
 DEFAULT_MDM_URL = "http://127.0.0.1:8001"
 DEFAULT_MGMT_URL = "http://127.0.0.1:5000"
 REQUEST_TIMEOUT = 30
+OCTET_STREAM = {'Content-Type': 'application/octet-stream'}
+JSON_CONTENT = {'Content-Type': 'application/json'}
+HEALTH_CACHE_TTL = 2.0  # Seconds a decoded GET /health* body is reused within a run
 
 # ANSI color codes
 GREEN = "\033[92m"
@@ -49,31 +56,66 @@ BLUE = "\033[94m"
 RESET = "\033[0m"
 
 
+def json_body(payload: Any) -> bytes:
+    """Serialize a request body once, for POSTing with data=... and JSON_CONTENT."""
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
 class TestResult:
-    """Track test results."""
+    """Track test results. Safe to update from several threads."""
     def __init__(self):
         self.passed = 0
         self.failed = 0
         self.skipped = 0
         self.errors = []
         self.warnings = []
+        self._lock = threading.Lock()
+        # Progress lines not yet written, per thread, so concurrent sections don't interleave
+        self._local = threading.local()
+
+    def _out(self, line: str):
+        buf = getattr(self._local, 'buf', None)
+        if buf is None:
+            buf = self._local.buf = []
+        buf.append(line)
+
+    def section(self, title: str):
+        self._out(f"\n{BLUE}{title}{RESET}")
 
     def add_pass(self, test_name: str):
-        self.passed += 1
-        print(f"{GREEN}✓{RESET} {test_name}")
+        with self._lock:
+            self.passed += 1
+        self._out(f"{GREEN}✓{RESET} {test_name}")
 
     def add_fail(self, test_name: str, error: str):
-        self.failed += 1
-        self.errors.append((test_name, error))
-        print(f"{RED}✗{RESET} {test_name}: {error}")
+        with self._lock:
+            self.failed += 1
+            self.errors.append((test_name, error))
+        self._out(f"{RED}✗{RESET} {test_name}: {error}")
 
     def add_skip(self, test_name: str, reason: str):
-        self.skipped += 1
-        print(f"{YELLOW}⊘{RESET} {test_name}: {reason}")
+        with self._lock:
+            self.skipped += 1
+        self._out(f"{YELLOW}⊘{RESET} {test_name}: {reason}")
 
     def add_warning(self, message: str):
-        self.warnings.append(message)
-        print(f"{YELLOW}⚠{RESET} {message}")
+        with self._lock:
+            self.warnings.append(message)
+        self._out(f"{YELLOW}⚠{RESET} {message}")
+
+    def take(self) -> List[str]:
+        """Remove and return the calling thread's buffered lines."""
+        buf = getattr(self._local, 'buf', None) or []
+        self._local.buf = []
+        return buf
+
+    def flush(self, lines: Optional[List[str]] = None):
+        """Write buffered lines (default: the calling thread's) with a single write."""
+        if lines is None:
+            lines = self.take()
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     def summary(self) -> str:
         total = self.passed + self.failed + self.skipped
@@ -116,17 +158,127 @@ class IntegrationTestSuite:
             'sdc_ids': [],
             'volume_ids': [],
         }
+        # Test topology depends only on the prefix, so it is built once per run.
+        # Bodies that don't need IDs returned at runtime are pre-serialized as bytes.
+        p = self.test_prefix
+        self.sds_configs = [
+            {'name': f"{p}_SDS1", 'capacity_gb': 128, 'devices': 'blk0,blk1,blk2', 'node_id': f'{p}-sds-1'},
+            {'name': f"{p}_SDS2", 'capacity_gb': 128, 'devices': 'blk0,blk1,blk2', 'node_id': f'{p}-sds-2'},
+        ]
+        self.sdc_configs = [
+            {'name': f"{p}_SDC1", 'node_id': f'{p}-sdc-1'},
+            {'name': f"{p}_SDC2", 'node_id': f'{p}-sdc-2'},
+        ]
+        self.volume_configs = [
+            {'name': f"{p}_VOL_THIN", 'size_gb': 0.1, 'provisioning': 'thin'},  # 100 MB
+            {'name': f"{p}_VOL_THICK", 'size_gb': 0.05, 'provisioning': 'thick'},  # 50 MB
+        ]
+        self.sds_nodes = [
+            {'node_id': cfg['node_id'], 'name': cfg['name'], 'address': '127.0.0.1', 'port': 9700, 'capabilities': ['SDS']}
+            for cfg in self.sds_configs
+        ]
+        self.sdc_nodes = [
+            {'node_id': cfg['node_id'], 'name': cfg['name'], 'address': '127.0.0.1', 'port': 8003, 'capabilities': ['SDC']}
+            for cfg in self.sdc_configs
+        ]
+        self._sds_register_body = json_body({'nodes': self.sds_nodes})
+        self._sdc_register_body = json_body({'nodes': self.sdc_nodes})
+        for cfg in self.sdc_configs:
+            cfg['body'] = json_body({'name': cfg['name'], 'cluster_node_id': cfg['node_id']})
+        # Data-integrity patterns: disjoint slices of one random buffer (incompressible, allocated
+        # once); no pattern is a prefix of another, so a misdirected read can't pass as a match
+        rand = os.urandom(4808)
+        self.integrity_patterns = [
+            (rand[0:8], 0),
+            (rand[8:808], 8192),
+            (rand[808:4808], 16384),
+        ]
+        # One keep-alive pool for the whole run: every call goes to one of two hosts
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        # Independent calls within a phase are fanned out; results are recorded on the main thread
+        self.pool = ThreadPoolExecutor(max_workers=8)
+        # url -> (decoded body, time.monotonic() when fetched); shared by pool threads
+        self._health_cache: Dict[str, tuple] = {}
+        self._health_lock = threading.Lock()
+        self._preconnect()
+
+    def _preconnect(self):
+        """Open a pooled connection to each host so the first test doesn't pay connection setup."""
+        for base in (self.mdm_url, self.mgmt_url):
+            try:
+                self.session.head(f"{base}/", timeout=2)  # Any status will do; only the socket matters
+            except requests.exceptions.RequestException:
+                pass  # Unreachable hosts are reported by the tests themselves
 
     def req(self, method: str, url: str, **kwargs) -> requests.Response:
         """Make HTTP request with timeout."""
         kwargs.setdefault('timeout', REQUEST_TIMEOUT)
         try:
-            resp = requests.request(method, url, **kwargs)
+            resp = self.session.request(method, url, **kwargs)
             resp.raise_for_status()
-            return resp
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"{method} {url} failed: {e}")
+        return resp
+
+    def get_health_json(self, url: str, use_cache: bool = True) -> Any:
+        """GET a health endpoint's decoded JSON, reused for HEALTH_CACHE_TTL unless use_cache=False."""
+        if use_cache:
+            with self._health_lock:
+                body, fetched_at = self._health_cache.get(url, (None, 0.0))
+            if body is not None and time.monotonic() - fetched_at < HEALTH_CACHE_TTL:
+                return body
+        # req() raises on non-2xx, so only successful bodies are ever cached
+        body = json.loads(self.req('GET', url).content)
+        with self._health_lock:
+            self._health_cache[url] = (body, time.monotonic())
+        return body
+
+    def _fire(self, method: str, url: str, **kwargs) -> None:
+        """Make HTTP request whose response body is never used; only the status is checked."""
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        try:
+            resp = self.session.request(method, url, stream=True, **kwargs)
+            try:
+                resp.raise_for_status()
+            finally:
+                # Discard the body unread; draining (not just closing) keeps the keep-alive connection
+                resp.raw.drain_conn()
+                resp.close()
         except requests.exceptions.RequestException as e:
             raise Exception(f"{method} {url} failed: {e}")
 
+    def _register_nodes(self, nodes: List[Dict[str, Any]], bulk_body: bytes):
+        """Register cluster nodes in one call, falling back to per-node registration on older MDMs."""
+        url = f"{self.mdm_url}/cluster/nodes/register_bulk"
+        try:
+            resp = self.session.post(url, data=bulk_body, headers=JSON_CONTENT, timeout=REQUEST_TIMEOUT)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"POST {url} failed: {e}")
+        if resp.status_code not in (404, 405):
+            try:
+                resp.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"POST {url} failed: {e}")
+            return
+        for node in nodes:
+            self.req('POST', f"{self.mdm_url}/cluster/nodes/register", json=node)
+
+    def _record(self, test_name: str, resource_id: Any, error: Optional[str], collect: Optional[List] = None):
+        """Record a worker's (name, id, error) outcome; called on the main thread only."""
+        if error is not None:
+            self.results.add_fail(test_name, error)
+            return
+        if collect is not None:
+            collect.append(resource_id)
+        self.results.add_pass(test_name)
+
     # ======================================================================
     # TEST SECTION 1: Service Availability
     # ======================================================================
@@ -135,7 +287,7 @@ class IntegrationTestSuite:
         """Test MDM service is running and responding."""
         try:
             resp = self.req('GET', f"{self.mdm_url}/")
-            body = resp.json()
+            body = json.loads(resp.content)
             # Current implementation returns 'mdm', Phase 7+ returns 'powerflex-mdm'
             if body.get('service') not in ['mdm', 'powerflex-mdm']:
                 raise Exception(f"Unexpected service name: {body.get('service')}")
@@ -146,9 +298,8 @@ class IntegrationTestSuite:
     def test_mgmt_availability(self):
         """Test MGMT service is running and responding."""
         try:
-            resp = self.req('GET', f"{self.mgmt_url}/health")
-            if resp.status_code != 200:
-                raise Exception(f"Status {resp.status_code}")
+            # HEAD: only the status matters here, so skip transferring the dashboard HTML
+            self._fire('HEAD', f"{self.mgmt_url}/health")
             self.results.add_pass("MGMT service availability")
         except Exception as e:
             self.results.add_fail("MGMT service availability", str(e))
@@ -160,15 +311,22 @@ class IntegrationTestSuite:
             '/health/components': list,  # Returns list of components
             '/health/metrics': dict,  # Returns metrics dict
         }
-        for endpoint, expected_type in endpoints.items():
-            try:
-                resp = self.req('GET', f"{self.mdm_url}{endpoint}")
-                body = resp.json()
-                if not isinstance(body, expected_type):
-                    raise Exception(f"Expected {expected_type.__name__}, got {type(body)}")
-                self.results.add_pass(f"MDM health endpoint {endpoint}")
-            except Exception as e:
-                self.results.add_fail(f"MDM health endpoint {endpoint}", str(e))
+        futures = [
+            self.pool.submit(self._check_health_endpoint, endpoint, expected_type)
+            for endpoint, expected_type in endpoints.items()
+        ]
+        for future in futures:
+            self._record(*future.result())
+
+    def _check_health_endpoint(self, endpoint: str, expected_type: type):
+        name = f"MDM health endpoint {endpoint}"
+        try:
+            body = self.get_health_json(f"{self.mdm_url}{endpoint}")
+            if not isinstance(body, expected_type):
+                raise Exception(f"Expected {expected_type.__name__}, got {type(body)}")
+            return name, None, None
+        except Exception as e:
+            return name, None, str(e)
 
     # ======================================================================
     # TEST SECTION 2: Cluster Topology Creation
@@ -180,7 +338,7 @@ class IntegrationTestSuite:
             resp = self.req('POST', f"{self.mdm_url}/pd/create", json={
                 'name': f"{self.test_prefix}_PD"
             })
-            body = resp.json()
+            body = json.loads(resp.content)
             pd_id = body.get('id')
             if not pd_id:
                 raise Exception(f"No id in response: {body}")
@@ -196,38 +354,38 @@ class IntegrationTestSuite:
             return
         
         pd_id = self.test_resources['pd_id']
-        sds_configs = [
-            {'name': f"{self.test_prefix}_SDS1", 'capacity_gb': 128, 'devices': 'blk0,blk1,blk2', 'node_id': f'{self.test_prefix}-sds-1'},
-            {'name': f"{self.test_prefix}_SDS2", 'capacity_gb': 128, 'devices': 'blk0,blk1,blk2', 'node_id': f'{self.test_prefix}-sds-2'},
-        ]
+        sds_configs = self.sds_configs
         
-        for sds_cfg in sds_configs:
-            try:
-                # First, register cluster node with SDS capability
-                self.req('POST', f"{self.mdm_url}/cluster/nodes/register", json={
-                    'node_id': sds_cfg['node_id'],
-                    'name': sds_cfg['name'],
-                    'address': '127.0.0.1',
-                    'port': 9700,
-                    'capabilities': ['SDS'],
-                })
-                
-                # Then add SDS
-                resp = self.req('POST', f"{self.mdm_url}/sds/add", json={
-                    'name': sds_cfg['name'],
-                    'total_capacity_gb': sds_cfg['capacity_gb'],
-                    'devices': sds_cfg['devices'],
-                    'protection_domain_id': pd_id,
-                    'cluster_node_id': sds_cfg['node_id'],
-                })
-                body = resp.json()
-                sds_id = body.get('id')
-                if not sds_id:
-                    raise Exception(f"No id in response: {body}")
-                self.test_resources['sds_ids'].append(sds_id)
-                self.results.add_pass(f"Add SDS node {sds_cfg['name']}")
-            except Exception as e:
+        # First, register cluster nodes with SDS capability (one call for all nodes)
+        try:
+            self._register_nodes(self.sds_nodes, self._sds_register_body)
+        except Exception as e:
+            for sds_cfg in sds_configs:
                 self.results.add_fail(f"Add SDS node {sds_cfg['name']}", str(e))
+            return
+        
+        # Then add SDS
+        futures = [self.pool.submit(self._add_one_sds, pd_id, sds_cfg) for sds_cfg in sds_configs]
+        for future in futures:
+            self._record(*future.result(), self.test_resources['sds_ids'])
+
+    def _add_one_sds(self, pd_id: int, sds_cfg: Dict[str, Any]):
+        name = f"Add SDS node {sds_cfg['name']}"
+        try:
+            resp = self.req('POST', f"{self.mdm_url}/sds/add", json={
+                'name': sds_cfg['name'],
+                'total_capacity_gb': sds_cfg['capacity_gb'],
+                'devices': sds_cfg['devices'],
+                'protection_domain_id': pd_id,
+                'cluster_node_id': sds_cfg['node_id'],
+            })
+            body = json.loads(resp.content)
+            sds_id = body.get('id')
+            if not sds_id:
+                raise Exception(f"No id in response: {body}")
+            return name, sds_id, None
+        except Exception as e:
+            return name, None, str(e)
 
     def test_create_storage_pool(self):
         """Create a storage pool."""
@@ -242,7 +400,7 @@ class IntegrationTestSuite:
                 'protection_policy': 'two_copies',
                 'total_capacity_gb': 256,
             })
-            body = resp.json()
+            body = json.loads(resp.content)
             pool_id = body.get('id')
             if not pool_id:
                 raise Exception(f"No id in response: {body}")
@@ -253,35 +411,32 @@ class IntegrationTestSuite:
 
     def test_add_sdc_clients(self):
         """Add SDC clients."""
-        sdc_configs = [
-            {'name': f"{self.test_prefix}_SDC1", 'node_id': f'{self.test_prefix}-sdc-1'},
-            {'name': f"{self.test_prefix}_SDC2", 'node_id': f'{self.test_prefix}-sdc-2'},
-        ]
+        sdc_configs = self.sdc_configs
         
-        for sdc_cfg in sdc_configs:
-            try:
-                # First, register cluster node with SDC capability
-                self.req('POST', f"{self.mdm_url}/cluster/nodes/register", json={
-                    'node_id': sdc_cfg['node_id'],
-                    'name': sdc_cfg['name'],
-                    'address': '127.0.0.1',
-                    'port': 8003,
-                    'capabilities': ['SDC'],
-                })
-                
-                # Then add SDC
-                resp = self.req('POST', f"{self.mdm_url}/sdc/add", json={
-                    'name': sdc_cfg['name'],
-                    'cluster_node_id': sdc_cfg['node_id'],
-                })
-                body = resp.json()
-                sdc_id = body.get('id')
-                if not sdc_id:
-                    raise Exception(f"No id in response: {body}")
-                self.test_resources['sdc_ids'].append(sdc_id)
-                self.results.add_pass(f"Add SDC client {sdc_cfg['name']}")
-            except Exception as e:
+        # First, register cluster nodes with SDC capability (one call for all nodes)
+        try:
+            self._register_nodes(self.sdc_nodes, self._sdc_register_body)
+        except Exception as e:
+            for sdc_cfg in sdc_configs:
                 self.results.add_fail(f"Add SDC client {sdc_cfg['name']}", str(e))
+            return
+        
+        # Then add SDC
+        futures = [self.pool.submit(self._add_one_sdc, sdc_cfg) for sdc_cfg in sdc_configs]
+        for future in futures:
+            self._record(*future.result(), self.test_resources['sdc_ids'])
+
+    def _add_one_sdc(self, sdc_cfg: Dict[str, Any]):
+        name = f"Add SDC client {sdc_cfg['name']}"
+        try:
+            resp = self.req('POST', f"{self.mdm_url}/sdc/add", data=sdc_cfg['body'], headers=JSON_CONTENT)
+            body = json.loads(resp.content)
+            sdc_id = body.get('id')
+            if not sdc_id:
+                raise Exception(f"No id in response: {body}")
+            return name, sdc_id, None
+        except Exception as e:
+            return name, None, str(e)
 
     # ======================================================================
     # TEST SECTION 3: Volume Lifecycle
@@ -294,27 +449,26 @@ class IntegrationTestSuite:
             return
         
         pool_id = self.test_resources['pool_id']
-        volume_configs = [
-            {'name': f"{self.test_prefix}_VOL_THIN", 'size_gb': 0.1, 'provisioning': 'thin'},  # 100 MB
-            {'name': f"{self.test_prefix}_VOL_THICK", 'size_gb': 0.05, 'provisioning': 'thick'},  # 50 MB
-        ]
-        
-        for vol_cfg in volume_configs:
-            try:
-                resp = self.req('POST', f"{self.mdm_url}/vol/create", json={
-                    'name': vol_cfg['name'],
-                    'size_gb': vol_cfg['size_gb'],
-                    'provisioning': vol_cfg['provisioning'],
-                    'pool_id': pool_id,
-                })
-                body = resp.json()
-                vol_id = body.get('id')
-                if not vol_id:
-                    raise Exception(f"No id in response: {body}")
-                self.test_resources['volume_ids'].append(vol_id)
-                self.results.add_pass(f"Create volume {vol_cfg['name']}")
-            except Exception as e:
-                self.results.add_fail(f"Create volume {vol_cfg['name']}", str(e))
+        futures = [self.pool.submit(self._create_one_volume, pool_id, vol_cfg) for vol_cfg in self.volume_configs]
+        for future in futures:
+            self._record(*future.result(), self.test_resources['volume_ids'])
+
+    def _create_one_volume(self, pool_id: int, vol_cfg: Dict[str, Any]):
+        name = f"Create volume {vol_cfg['name']}"
+        try:
+            resp = self.req('POST', f"{self.mdm_url}/vol/create", json={
+                'name': vol_cfg['name'],
+                'size_gb': vol_cfg['size_gb'],
+                'provisioning': vol_cfg['provisioning'],
+                'pool_id': pool_id,
+            })
+            body = json.loads(resp.content)
+            vol_id = body.get('id')
+            if not vol_id:
+                raise Exception(f"No id in response: {body}")
+            return name, vol_id, None
+        except Exception as e:
+            return name, None, str(e)
 
     def test_map_volumes(self):
         """Map volumes to SDC clients."""
@@ -327,7 +481,7 @@ class IntegrationTestSuite:
             vol_id = self.test_resources['volume_ids'][0]
             sdc_id = self.test_resources['sdc_ids'][0]
             try:
-                self.req('POST', f"{self.mdm_url}/vol/map", params={
+                self._fire('POST', f"{self.mdm_url}/vol/map", params={
                     'volume_id': vol_id,
                     'sdc_id': sdc_id,
                     'access_mode': 'readWrite',
@@ -352,9 +506,9 @@ class IntegrationTestSuite:
             write_resp = self.req('POST', f"{self.mdm_url}/vol/{vol_id}/io/write", json={
                 'sdc_id': sdc_id,
                 'offset_bytes': test_offset,
-                'data_b64': base64.b64encode(test_data).decode('ascii'),
+                'data_b64': b2a_base64(test_data, newline=False).decode('ascii'),
             })
-            write_body = write_resp.json()
+            write_body = json.loads(write_resp.content)
             # Check for successful write (status='written' and bytes match)
             if write_body.get('status') != 'written':
                 raise Exception(f"Write status not 'written': {write_body}")
@@ -372,8 +526,8 @@ class IntegrationTestSuite:
                 'offset_bytes': test_offset,
                 'length_bytes': len(test_data),
             })
-            read_body = read_resp.json()
-            read_data = base64.b64decode(read_body.get('data_b64', ''))
+            read_body = json.loads(read_resp.content)
+            read_data = a2b_base64(read_body.get('data_b64', ''))
             if read_data != test_data:
                 raise Exception(f"Data mismatch: expected {test_data}, got {read_data}")
             self.results.add_pass(f"Volume read operation")
@@ -389,7 +543,7 @@ class IntegrationTestSuite:
         vol_id = self.test_resources['volume_ids'][0]
         sdc_id = self.test_resources['sdc_ids'][0]
         try:
-            self.req('POST', f"{self.mdm_url}/vol/unmap", params={
+            self._fire('POST', f"{self.mdm_url}/vol/unmap", params={
                 'volume_id': vol_id,
                 'sdc_id': sdc_id,
             })
@@ -404,8 +558,7 @@ class IntegrationTestSuite:
     def test_mgmt_health_dashboard(self):
         """Test MGMT health dashboard data."""
         try:
-            resp = self.req('GET', f"{self.mgmt_url}/health/api/summary")
-            body = resp.json()
+            body = self.get_health_json(f"{self.mgmt_url}/health/api/summary")
             
             # Check for nested structure returned by MGMT health_api_summary endpoint
             required_keys = ['health_summary', 'health_metrics', 'alert_counts']
@@ -426,8 +579,7 @@ class IntegrationTestSuite:
     def test_mgmt_component_monitoring(self):
         """Test MGMT component monitoring."""
         try:
-            resp = self.req('GET', f"{self.mgmt_url}/health/api/components")
-            body = resp.json()
+            body = self.get_health_json(f"{self.mgmt_url}/health/api/components")
             
             # Endpoint returns list of components directly (not wrapped in dict)
             if not isinstance(body, list):
@@ -444,7 +596,7 @@ class IntegrationTestSuite:
         """Test alert system functionality."""
         try:
             # Wait for monitor to poll at least once
-            time.sleep(2)
+            self._wait_for_monitor_poll(timeout=2.0)
             
             resp = self.req('GET', f"{self.mgmt_url}/alerts")
             if resp.status_code != 200:
@@ -454,35 +606,46 @@ class IntegrationTestSuite:
         except Exception as e:
             self.results.add_fail("Alert system", str(e))
 
+    def _wait_for_monitor_poll(self, timeout: float):
+        """Poll the MGMT summary every 100 ms until the monitor reports a completed poll."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                body = self.get_health_json(f"{self.mgmt_url}/health/api/summary", use_cache=False)
+                if body.get('last_poll_ts'):
+                    return
+            except Exception:
+                pass  # Reported by the caller's own request
+            time.sleep(0.1)
+
     # ======================================================================
     # TEST SECTION 5: Discovery & Registration
     # ======================================================================
 
     def test_discovery_topology(self):
         """Test discovery topology endpoint (Phase 2+ only)."""
+        # Branch on status codes instead of raising: a single GET when the Phase 2+ endpoint answers
         try:
-            # Try Phase 2+ discovery endpoint first
-            resp = self.req('GET', f"{self.mdm_url}/discovery/topology")
-            body = resp.json()
-            
-            if 'registered_components' not in body:
-                raise Exception("Missing 'registered_components' in topology")
+            resp = self.session.get(f"{self.mdm_url}/discovery/topology", timeout=REQUEST_TIMEOUT)
+            if resp.status_code == 200 and 'registered_components' in json.loads(resp.content):
+                self.results.add_pass("Discovery topology")
+                return
             
-            self.results.add_pass("Discovery topology")
-        except Exception:
             # Fall back to legacy cluster info
-            try:
-                resp = self.req('GET', f"{self.mdm_url}/cluster/info")
-                body = resp.json()
+            resp = self.session.get(f"{self.mdm_url}/cluster/info", timeout=REQUEST_TIMEOUT)
+            if resp.status_code == 200:
+                json.loads(resp.content)
                 self.results.add_pass("Cluster info (legacy)")
-            except Exception as e:
-                self.results.add_skip("Discovery topology (Phase 2+)", "Not implemented in current code")
+                return
+        except (requests.exceptions.RequestException, ValueError):
+            pass
+        self.results.add_skip("Discovery topology (Phase 2+)", "Not implemented in current code")
 
     def test_cluster_metrics(self):
         """Test cluster metrics endpoint."""
         try:
             resp = self.req('GET', f"{self.mdm_url}/metrics/cluster")
-            body = resp.json()
+            body = json.loads(resp.content)
             
             # Check for correct structure (nested under 'storage', 'volumes', 'nodes', 'health')
             required_sections = ['storage', 'volumes', 'nodes', 'health']
@@ -509,7 +672,7 @@ class IntegrationTestSuite:
         
         # Re-map volume if needed (may have been unmapped in previous tests)
         try:
-            self.req('POST', f"{self.mdm_url}/vol/map", params={
+            self._fire('POST', f"{self.mdm_url}/vol/map", params={
                 'volume_id': vol_id,
                 'sdc_id': sdc_id,
                 'access_mode': 'readWrite',
@@ -519,66 +682,84 @@ class IntegrationTestSuite:
             pass
         
         # Write and read multiple patterns
-        patterns = [
-            (b"pattern1", 0),
-            (b"pattern2" * 100, 8192),
-            (b"pattern3" * 500, 16384),
-        ]
+        patterns = self.integrity_patterns
         
-        for data, offset in patterns:
-            try:
-                # Write
-                self.req('POST', f"{self.mdm_url}/vol/{vol_id}/io/write", json={
-                    'sdc_id': sdc_id,
-                    'offset_bytes': offset,
-                    'data_b64': base64.b64encode(data).decode('ascii'),
-                })
-                
-                # Read back
-                read_resp = self.req('POST', f"{self.mdm_url}/vol/{vol_id}/io/read", json={
-                    'sdc_id': sdc_id,
-                    'offset_bytes': offset,
-                    'length_bytes': len(data),
-                })
-                read_data = base64.b64decode(read_resp.json().get('data_b64', ''))
-                
-                if read_data != data:
-                    raise Exception(f"Data mismatch at offset {offset}")
-                
-            except Exception as e:
-                self.results.add_fail(f"Data integrity at offset {offset}", str(e))
-                return
+        # Offsets don't overlap, so all writes go out as one parallel wave, then all reads
+        io_url = f"{self.mdm_url}/vol/{vol_id}/io"
+        for step in (self._write_pattern, self._read_pattern):
+            futures = [self.pool.submit(step, io_url, sdc_id, data, offset) for data, offset in patterns]
+            for (data, offset), future in zip(patterns, futures):
+                error = future.result()
+                if error is not None:
+                    self.results.add_fail(f"Data integrity at offset {offset}", error)
+                    return
         
         self.results.add_pass("Data integrity test")
 
+    def _write_pattern(self, io_url: str, sdc_id: int, data: bytes, offset: int) -> Optional[str]:
+        try:
+            # Raw body: no base64/JSON wrapping on either side
+            self._fire('POST', f"{io_url}/write_raw", params={
+                'sdc_id': sdc_id,
+                'offset_bytes': offset,
+            }, data=data, headers=OCTET_STREAM)
+            return None
+        except Exception as e:
+            return str(e)
+
+    def _read_pattern(self, io_url: str, sdc_id: int, data: bytes, offset: int) -> Optional[str]:
+        try:
+            read_resp = self.req('GET', f"{io_url}/read_raw", params={
+                'sdc_id': sdc_id,
+                'offset_bytes': offset,
+                'length_bytes': len(data),
+            })
+            if read_resp.content != data:
+                raise Exception(f"Data mismatch at offset {offset}")
+            return None
+        except Exception as e:
+            return str(e)
+
     # ======================================================================
     # TEST SECTION 7: Cleanup
     # ======================================================================
 
     def test_cleanup_volumes(self):
         """Delete test volumes."""
-        for vol_id in self.test_resources['volume_ids']:
-            try:
-                # Try to unmap all SDCs from this volume first (might fail if already unmapped)
-                for sdc_id in self.test_resources.get('sdc_ids', []):
-                    try:
-                        self.req('POST', f"{self.mdm_url}/vol/unmap", params={
-                            'volume_id': vol_id,
-                            'sdc_id': sdc_id,
-                        })
-                    except Exception:
-                        pass  # Ignore if already unmapped
-                
-                # Now delete the volume
-                self.req('DELETE', f"{self.mdm_url}/vol/{vol_id}")
-                self.results.add_pass(f"Delete volume {vol_id}")
-            except Exception as e:
-                self.results.add_fail(f"Delete volume {vol_id}", str(e))
+        futures = [self.pool.submit(self._delete_one_volume, vol_id) for vol_id in self.test_resources['volume_ids']]
+        for future in futures:
+            self._record(*future.result())
+
+    def _delete_one_volume(self, vol_id: int):
+        name = f"Delete volume {vol_id}"
+        try:
+            # Drop whatever mappings remain in one call (no per-SDC "already unmapped" failures)
+            self._fire('POST', f"{self.mdm_url}/vol/{vol_id}/unmap_all")
+            
+            # Now delete the volume
+            self._fire('DELETE', f"{self.mdm_url}/vol/{vol_id}")
+            return name, None, None
+        except Exception as e:
+            return name, None, str(e)
 
     # ======================================================================
     # Main Test Runner
     # ======================================================================
 
+    def _run_monitoring_sections(self) -> List[str]:
+        """Run sections 4-5 and return their output lines (runs on a worker thread)."""
+        # Section 4: Health Monitoring
+        self.results.section("[4/7] Health Monitoring & Alerts")
+        self.test_mgmt_health_dashboard()
+        self.test_mgmt_component_monitoring()
+        self.test_alert_system()
+        
+        # Section 5: Discovery
+        self.results.section("[5/7] Discovery & Registration")
+        self.test_discovery_topology()
+        self.test_cluster_metrics()
+        return self.results.take()
+
     def run_all(self):
         """Run all integration tests."""
         print(f"\n{BLUE}{'='*60}{RESET}")
@@ -588,46 +769,47 @@ class IntegrationTestSuite:
         print(f"MGMT URL: {self.mgmt_url}")
         print(f"Test Prefix: {self.test_prefix}")
         print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{BLUE}{'='*60}{RESET}\n")
+        print(f"{BLUE}{'='*60}{RESET}")
         
         # Section 1: Service Availability
-        print(f"{BLUE}[1/7] Service Availability{RESET}")
+        self.results.section("[1/7] Service Availability")
         self.test_mdm_availability()
         self.test_mgmt_availability()
         self.test_mdm_health_endpoints()
+        self.results.flush()
         
         # Section 2: Cluster Topology
-        print(f"\n{BLUE}[2/7] Cluster Topology Creation{RESET}")
+        self.results.section("[2/7] Cluster Topology Creation")
         self.test_create_protection_domain()
         self.test_add_sds_nodes()
         self.test_create_storage_pool()
         self.test_add_sdc_clients()
+        self.results.flush()
         
-        # Section 3: Volume Lifecycle
-        print(f"\n{BLUE}[3/7] Volume Lifecycle{RESET}")
-        self.test_create_volumes()
-        self.test_map_volumes()
-        self.test_volume_io_operations()
-        self.test_unmap_volumes()
-        
-        # Section 4: Health Monitoring
-        print(f"\n{BLUE}[4/7] Health Monitoring & Alerts{RESET}")
-        self.test_mgmt_health_dashboard()
-        self.test_mgmt_component_monitoring()
-        self.test_alert_system()
-        
-        # Section 5: Discovery
-        print(f"\n{BLUE}[5/7] Discovery & Registration{RESET}")
-        self.test_discovery_topology()
-        self.test_cluster_metrics()
+        # Sections 4-5 only need the topology from section 2, so they run alongside section 3.
+        # Their output is buffered on the worker thread and printed after section 3's.
+        with ThreadPoolExecutor(max_workers=1) as section_pool:
+            monitoring = section_pool.submit(self._run_monitoring_sections)
+            
+            # Section 3: Volume Lifecycle
+            self.results.section("[3/7] Volume Lifecycle")
+            self.test_create_volumes()
+            self.test_map_volumes()
+            self.test_volume_io_operations()
+            self.test_unmap_volumes()
+            self.results.flush()
+            
+            self.results.flush(monitoring.result())
         
-        # Section 6: Data Validation
-        print(f"\n{BLUE}[6/7] Data Validation{RESET}")
+        # Section 6: Data Validation (needs the volumes from section 3)
+        self.results.section("[6/7] Data Validation")
         self.test_data_integrity()
+        self.results.flush()
         
         # Section 7: Cleanup
-        print(f"\n{BLUE}[7/7] Cleanup{RESET}")
+        self.results.section("[7/7] Cleanup")
         self.test_cleanup_volumes()
+        self.results.flush()
         
         # Print summary
         print(self.results.summary())
@@ -644,7 +826,11 @@ def main():
     args = parser.parse_args()
     
     suite = IntegrationTestSuite(args.mdm_url, args.mgmt_url)
-    exit_code = suite.run_all()
+    try:
+        exit_code = suite.run_all()
+    finally:
+        suite.pool.shutdown(wait=False)
+        suite.session.close()
     sys.exit(exit_code)
 
 
@@ -2,9 +2,18 @@ import argparse
 import base64
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
+
+# One keep-alive connection pool for the whole validation run
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+SESSION.headers["Connection"] = "keep-alive"
 
 
 class DemoValidationError(RuntimeError):
@@ -13,7 +22,7 @@ class DemoValidationError(RuntimeError):
 
 def req(base_url: str, method: str, path: str, **kwargs: Any) -> requests.Response:
     url = f"{base_url.rstrip('/')}{path}"
-    response = requests.request(method, url, timeout=20, **kwargs)
+    response = SESSION.request(method, url, timeout=20, **kwargs)
     return response
 
 
@@ -69,30 +78,45 @@ def run_validation(base_url: str, address_base: str, control_base_port: int, dat
     pd = req_json(base_url, "POST", "/pd/create", json={"name": f"VAL_PD_{ts}"})
     pd_id = int(pd["id"])
 
-    sds1 = req_json(
-        base_url,
-        "POST",
-        "/sds/add",
-        json={
-            "name": f"VAL_SDS1_{ts}",
-            "total_capacity_gb": 8,
-            "devices": "blk0,blk1",
-            "protection_domain_id": pd_id,
-            "cluster_node_id": f"{prefix}-sds-1",
-        },
-    )
-    sds2 = req_json(
-        base_url,
-        "POST",
-        "/sds/add",
-        json={
-            "name": f"VAL_SDS2_{ts}",
-            "total_capacity_gb": 8,
-            "devices": "blk0,blk1",
-            "protection_domain_id": pd_id,
-            "cluster_node_id": f"{prefix}-sds-2",
-        },
-    )
+    # Both SDS adds and the SDC add only need the PD and bootstrap nodes: issue them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        sds1_future = executor.submit(
+            req_json,
+            base_url,
+            "POST",
+            "/sds/add",
+            json={
+                "name": f"VAL_SDS1_{ts}",
+                "total_capacity_gb": 8,
+                "devices": "blk0,blk1",
+                "protection_domain_id": pd_id,
+                "cluster_node_id": f"{prefix}-sds-1",
+            },
+        )
+        sds2_future = executor.submit(
+            req_json,
+            base_url,
+            "POST",
+            "/sds/add",
+            json={
+                "name": f"VAL_SDS2_{ts}",
+                "total_capacity_gb": 8,
+                "devices": "blk0,blk1",
+                "protection_domain_id": pd_id,
+                "cluster_node_id": f"{prefix}-sds-2",
+            },
+        )
+        sdc_future = executor.submit(
+            req_json,
+            base_url,
+            "POST",
+            "/sdc/add",
+            json={"name": f"VAL_SDC_{ts}", "cluster_node_id": f"{prefix}-sdc-1"},
+        )
+        sds1 = sds1_future.result()
+        sds2 = sds2_future.result()
+        sdc = sdc_future.result()
+    sdc_id = int(sdc["id"])
 
     pool = req_json(
         base_url,
@@ -107,14 +131,6 @@ def run_validation(base_url: str, address_base: str, control_base_port: int, dat
     )
     pool_id = int(pool["id"])
 
-    sdc = req_json(
-        base_url,
-        "POST",
-        "/sdc/add",
-        json={"name": f"VAL_SDC_{ts}", "cluster_node_id": f"{prefix}-sdc-1"},
-    )
-    sdc_id = int(sdc["id"])
-
     vol = req_json(
         base_url,
         "POST",
@@ -131,15 +147,20 @@ def run_validation(base_url: str, address_base: str, control_base_port: int, dat
     )
 
     payload = f"doD-roundtrip-{ts}".encode("utf-8")
-    write_body = {
-        "sdc_id": sdc_id,
-        "offset_bytes": 4096,
-        "data_b64": base64.b64encode(payload).decode("ascii"),
-    }
-    write_resp = req_json(base_url, "POST", f"/vol/{vol_id}/io/write", json=write_body)
-
-    read_body = {"sdc_id": sdc_id, "offset_bytes": 4096, "length_bytes": len(payload)}
-    read_resp = req_json(base_url, "POST", f"/vol/{vol_id}/io/read", json=read_body)
+    # Write then read back in one round-trip via the volume IO batch endpoint
+    batch = req_json(
+        base_url,
+        "POST",
+        f"/vol/{vol_id}/io/batch",
+        json={
+            "sdc_id": sdc_id,
+            "ops": [
+                {"op": "write", "offset_bytes": 4096, "data_b64": base64.b64encode(payload).decode("ascii")},
+                {"op": "read", "offset_bytes": 4096, "length_bytes": len(payload)},
+            ],
+        },
+    )
+    write_resp, read_resp = batch["results"]
     read_back = base64.b64decode(str(read_resp.get("data_b64", "")).encode("ascii"))
 
     if read_back != payload:
@@ -150,6 +171,7 @@ def run_validation(base_url: str, address_base: str, control_base_port: int, dat
     sds1_id = int(sds1["id"])
     req_json(base_url, "POST", f"/sds/{sds1_id}/fail")
 
+    read_body = {"sdc_id": sdc_id, "offset_bytes": 4096, "length_bytes": len(payload)}
     post_fail_read = req_json(base_url, "POST", f"/vol/{vol_id}/io/read", json=read_body)
     read_after_fail = base64.b64decode(str(post_fail_read.get("data_b64", "")).encode("ascii"))
     if read_after_fail != payload:
@@ -200,12 +222,15 @@ def main() -> None:
     parser.add_argument("--output", default="", help="Optional JSON report output path")
     args = parser.parse_args()
 
-    report = run_validation(
-        base_url=args.base_url,
-        address_base=args.address_base,
-        control_base_port=args.control_base_port,
-        data_base_port=args.data_base_port,
-    )
+    try:
+        report = run_validation(
+            base_url=args.base_url,
+            address_base=args.address_base,
+            control_base_port=args.control_base_port,
+            data_base_port=args.data_base_port,
+        )
+    finally:
+        SESSION.close()
     pretty = json.dumps(report, indent=2, default=str)
     print(pretty)
 
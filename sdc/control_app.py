@@ -7,16 +7,24 @@ Handles volume mapping notifications from MDM and chunk location updates.
 Endpoints:
 - POST /control/volume_mapped: MDM notifies SDC of new volume mapping
 - POST /control/volume_unmapped: MDM notifies SDC of volume unmapping
-- POST /control/plan_update: MDM sends updated IO plan (chunk locations)
+- POST /control/plan_update: MDM sends updated IO plan (chunk locations); group-committed
+  by a writer thread, so a burst of updates costs one transaction instead of one each
 - GET /control/mappings: List all active volume mappings (for debugging)
+
+Volume mappings are also mirrored in memory (write-through): list_mappings and the
+NBD server's mapping checks read the dict instead of querying SQLite.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
+from sqlalchemy.dialects.sqlite import insert
 from sqlalchemy.orm import Session
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import datetime
 import logging
+import queue
+import threading
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +40,43 @@ def set_db_session_factory(factory):
     _db_session_factory = factory
 
 
+# In-memory mirror of volume_mappings_cache, keyed by volume_id (loaded once, then written through)
+_mapping_cache: Dict[int, Dict[str, Any]] = {}
+_mapping_cache_loaded = False
+_mapping_cache_lock = threading.Lock()
+
+
+def _ensure_mapping_cache(factory) -> None:
+    global _mapping_cache_loaded
+    if _mapping_cache_loaded:
+        return
+    from sdc.models import VolumeMappingCache
+    
+    with _mapping_cache_lock:
+        if _mapping_cache_loaded:
+            return
+        db = factory()
+        try:
+            for mapping in db.query(VolumeMappingCache).all():
+                _mapping_cache[mapping.volume_id] = {  # type: ignore[index]
+                    "volume_id": mapping.volume_id,
+                    "volume_name": mapping.volume_name,
+                    "size_bytes": mapping.size_bytes,
+                    "access_mode": mapping.access_mode,
+                    "mapped_at": mapping.mapped_at,
+                    "io_count": mapping.io_count,
+                }
+        finally:
+            db.close()
+        _mapping_cache_loaded = True
+
+
+def get_cached_mapping(volume_id: int, db_session_factory=None) -> Optional[Dict[str, Any]]:
+    """Return cached mapping info for volume_id, or None if it is not mapped to this SDC."""
+    _ensure_mapping_cache(db_session_factory or _db_session_factory)
+    return _mapping_cache.get(volume_id)
+
+
 def get_db():
     """Dependency for database sessions"""
     if _db_session_factory is None:
@@ -83,37 +128,46 @@ def volume_mapped(request: VolumeMappedRequest, db: Session = Depends(get_db)):
     """
     from sdc.models import VolumeMappingCache
     
-    # Check if already exists
-    existing = db.query(VolumeMappingCache).filter(
-        VolumeMappingCache.volume_id == request.volume_id
-    ).first()
+    # Single-statement upsert; RETURNING hands back the row's mapped_at/io_count, and a mapped_at
+    # equal to ours means the row was inserted rather than updated
+    now = datetime.utcnow()
+    stmt = insert(VolumeMappingCache).values(
+        volume_id=request.volume_id,
+        volume_name=request.volume_name,
+        size_bytes=request.size_bytes,
+        access_mode=request.access_mode,
+        mapped_at=now,
+        io_count=0
+    ).on_conflict_do_update(
+        index_elements=[VolumeMappingCache.volume_id],
+        set_={
+            "volume_name": request.volume_name,
+            "size_bytes": request.size_bytes,
+            "access_mode": request.access_mode,
+        }
+    ).returning(VolumeMappingCache.mapped_at, VolumeMappingCache.io_count)
+    mapped_at, io_count = db.execute(stmt).one()
+    db.commit()
+    _cache_mapping(request, mapped_at, io_count)
     
-    if existing:
-        # Update existing mapping
-        existing.volume_name = request.volume_name  # type: ignore[assignment]
-        existing.size_bytes = request.size_bytes  # type: ignore[assignment]
-        existing.access_mode = request.access_mode  # type: ignore[assignment]
-        db.commit()
-        
+    if mapped_at != now:
         logger.info(f"Updated volume mapping: {request.volume_id} ({request.volume_name})")
         return {"status": "updated", "volume_id": request.volume_id}
     
-    else:
-        # Create new mapping
-        mapping = VolumeMappingCache(
-            volume_id=request.volume_id,
-            volume_name=request.volume_name,
-            size_bytes=request.size_bytes,
-            access_mode=request.access_mode,
-            mapped_at=datetime.utcnow(),
-            io_count=0
-        )
-        
-        db.add(mapping)
-        db.commit()
-        
-        logger.info(f"Cached volume mapping: {request.volume_id} ({request.volume_name})")
-        return {"status": "mapped", "volume_id": request.volume_id}
+    logger.info(f"Cached volume mapping: {request.volume_id} ({request.volume_name})")
+    return {"status": "mapped", "volume_id": request.volume_id}
+
+
+def _cache_mapping(request: VolumeMappedRequest, mapped_at, io_count) -> None:
+    with _mapping_cache_lock:
+        _mapping_cache[request.volume_id] = {
+            "volume_id": request.volume_id,
+            "volume_name": request.volume_name,
+            "size_bytes": request.size_bytes,
+            "access_mode": request.access_mode,
+            "mapped_at": mapped_at,
+            "io_count": io_count,
+        }
 
 
 @router.post("/volume_unmapped")
@@ -135,6 +189,8 @@ def volume_unmapped(request: VolumeUnmappedRequest, db: Session = Depends(get_db
     ).delete()
     
     db.commit()
+    with _mapping_cache_lock:
+        _mapping_cache.pop(request.volume_id, None)
     
     if deleted_mappings > 0:
         logger.info(f"Removed volume mapping: {request.volume_id} (cleared {deleted_chunks} chunk cache entries)")
@@ -144,66 +200,138 @@ def volume_unmapped(request: VolumeUnmappedRequest, db: Session = Depends(get_db
         return {"status": "not_found", "volume_id": request.volume_id}
 
 
+# plan_update group commit: handlers queue their update and wait; the writer thread upserts
+# everything queued (up to PLAN_UPDATE_BATCH_MAX) in one transaction
+PLAN_UPDATE_BATCH_MAX = 64
+PLAN_UPDATE_TIMEOUT_SECONDS = 10.0
+_plan_updates: "queue.Queue[tuple[PlanUpdateRequest, Future]]" = queue.Queue(maxsize=1024)
+_plan_writer: Optional[threading.Thread] = None
+_plan_writer_lock = threading.Lock()
+
+
+def _upsert_chunk_location(db: Session, request: PlanUpdateRequest) -> str:
+    from sdc.models import ChunkLocation
+    
+    # Single-statement upsert on (volume_id, chunk_id); cached_at is only set on insert
+    now = datetime.utcnow()
+    stmt = insert(ChunkLocation).values(
+        volume_id=request.volume_id,
+        chunk_id=request.chunk_id,
+        sds_address=request.sds_address,
+        sds_data_port=request.sds_data_port,
+        generation=request.generation,
+        cached_at=now,
+        last_used_at=now
+    ).on_conflict_do_update(
+        index_elements=[ChunkLocation.volume_id, ChunkLocation.chunk_id],
+        set_={
+            "sds_address": request.sds_address,
+            "sds_data_port": request.sds_data_port,
+            "generation": request.generation,
+            "last_used_at": now,
+        }
+    ).returning(ChunkLocation.cached_at)
+    cached_at = db.execute(stmt).scalar_one()
+    return "cached" if cached_at == now else "updated"
+
+
+def _commit_plan_updates(batch: list) -> None:
+    """Upsert a batch in one transaction and resolve each caller's future with its status."""
+    db = None
+    try:
+        db = _db_session_factory()
+        statuses = [_upsert_chunk_location(db, request) for request, _ in batch]
+        db.commit()
+    except Exception as e:
+        if db is not None:
+            db.rollback()
+        if len(batch) > 1:
+            # Retry row by row so one bad update does not fail every caller in the batch
+            logger.warning(f"Plan update batch of {len(batch)} failed ({e}); retrying individually")
+            for item in batch:
+                _commit_plan_updates([item])
+            return
+        logger.error(f"Plan update failed: {e}")
+        batch[0][1].set_exception(e)
+    else:
+        for (_, future), status in zip(batch, statuses):
+            future.set_result(status)
+    finally:
+        if db is not None:
+            db.close()
+
+
+def _plan_update_writer() -> None:
+    """Background writer: drain queued plan updates and commit each batch once."""
+    while True:
+        batch = []
+        item = _plan_updates.get()
+        while True:
+            # Skip updates whose caller already gave up (timed out and cancelled)
+            if item[1].set_running_or_notify_cancel():
+                batch.append(item)
+            if len(batch) >= PLAN_UPDATE_BATCH_MAX:
+                break
+            try:
+                item = _plan_updates.get_nowait()
+            except queue.Empty:
+                break
+        
+        if not batch:
+            continue
+        try:
+            _commit_plan_updates(batch)
+        except Exception as e:
+            # Never let the writer die: fail whatever is still unresolved and keep serving
+            logger.error(f"Plan update writer error: {e}", exc_info=True)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+def _submit_plan_update(request: PlanUpdateRequest) -> str:
+    global _plan_writer
+    if _plan_writer is None or not _plan_writer.is_alive():
+        with _plan_writer_lock:
+            if _plan_writer is None or not _plan_writer.is_alive():
+                _plan_writer = threading.Thread(target=_plan_update_writer, name="sdc-plan-writer", daemon=True)
+                _plan_writer.start()
+    
+    future: Future = Future()
+    try:
+        _plan_updates.put((request, future), timeout=PLAN_UPDATE_TIMEOUT_SECONDS)
+        return future.result(timeout=PLAN_UPDATE_TIMEOUT_SECONDS)
+    except (queue.Full, FutureTimeoutError):
+        future.cancel()
+        raise HTTPException(status_code=503, detail="Plan update not committed in time; retry")
+
+
 @router.post("/plan_update")
-def plan_update(request: PlanUpdateRequest, db: Session = Depends(get_db)):
+def plan_update(request: PlanUpdateRequest):
     """
     Handle chunk location update from MDM.
-    Update local cache with new SDS location.
+    Update local cache with new SDS location (returns once the update is committed).
     """
-    from sdc.models import ChunkLocation
+    if _db_session_factory is None:
+        raise HTTPException(status_code=500, detail="Database not initialized")
     
-    # Check if chunk location already cached
-    existing = db.query(ChunkLocation).filter(
-        ChunkLocation.volume_id == request.volume_id,
-        ChunkLocation.chunk_id == request.chunk_id
-    ).first()
+    status = _submit_plan_update(request)
     
-    if existing:
-        # Update existing entry
-        existing.sds_address = request.sds_address  # type: ignore[assignment]
-        existing.sds_data_port = request.sds_data_port  # type: ignore[assignment]
-        existing.generation = request.generation  # type: ignore[assignment]
-        existing.last_used_at = datetime.utcnow()  # type: ignore[assignment]
-        db.commit()
-        
+    if status == "updated":
         logger.debug(f"Updated chunk location: vol={request.volume_id} chunk={request.chunk_id} → {request.sds_address}:{request.sds_data_port}")
-        return {"status": "updated"}
-    
     else:
-        # Create new entry
-        location = ChunkLocation(
-            volume_id=request.volume_id,
-            chunk_id=request.chunk_id,
-            sds_address=request.sds_address,
-            sds_data_port=request.sds_data_port,
-            generation=request.generation,
-            cached_at=datetime.utcnow(),
-            last_used_at=datetime.utcnow()
-        )
-        
-        db.add(location)
-        db.commit()
-        
         logger.debug(f"Cached chunk location: vol={request.volume_id} chunk={request.chunk_id} → {request.sds_address}:{request.sds_data_port}")
-        return {"status": "cached"}
+    return {"status": status}
 
 
 @router.get("/mappings", response_model=List[MappingInfo])
-def list_mappings(db: Session = Depends(get_db)):
+def list_mappings():
     """List all active volume mappings (for debugging)"""
-    from sdc.models import VolumeMappingCache
-    
-    mappings = db.query(VolumeMappingCache).all()
+    if _db_session_factory is None:
+        raise HTTPException(status_code=500, detail="Database not initialized")
+    _ensure_mapping_cache(_db_session_factory)
     
-    result = []
-    for mapping in mappings:
-        result.append(MappingInfo(
-            volume_id=mapping.volume_id,  # type: ignore[attr-defined]
-            volume_name=mapping.volume_name,  # type: ignore[attr-defined]
-            size_bytes=mapping.size_bytes,  # type: ignore[attr-defined]
-            access_mode=mapping.access_mode,  # type: ignore[attr-defined]
-            mapped_at=mapping.mapped_at,  # type: ignore[attr-defined]
-            io_count=mapping.io_count  # type: ignore[attr-defined]
-        ))
+    with _mapping_cache_lock:
+        mappings = list(_mapping_cache.values())
     
-    return result
+    return [MappingInfo(**mapping) for mapping in mappings]
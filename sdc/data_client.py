@@ -7,21 +7,25 @@ This module handles the actual data transfer after token acquisition.
 IO Flow:
 1. Receive IO request from NBD server
 2. Acquire token from MDM (token_requester)
-3. Connect to SDS data port (TCP socket)
+3. Connect to SDS data port (TCP socket, pooled and reused across IOs)
 4. Send IO request with token
 5. Receive response (data for reads, ok/error for writes)
 6. Return to NBD client
 
-Uses shared socket protocol (newline-delimited JSON frames).
+Uses shared socket protocol (newline-delimited JSON frames). IO data travels as a
+raw payload after the JSON header ("payload_bytes") rather than base64 in the JSON.
 """
 
 import socket
 import json
 import base64
 import logging
+import queue
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import Optional, Dict, Any, Tuple
 
-from shared.socket_protocol import SocketProtocol
+from shared.socket_protocol import SocketProtocol, tune_data_socket
 
 logger = logging.getLogger(__name__)
 
@@ -29,17 +33,136 @@ logger = logging.getLogger(__name__)
 class SDCDataClient:
     """Execute IO operations to SDS with token verification"""
     
-    def __init__(self, timeout_seconds: float = 30.0):
+    def __init__(
+        self,
+        timeout_seconds: float = 30.0,
+        max_idle_per_sds: int = 8,
+        max_workers: int = 16,
+        read_hedge_width: int = 2
+    ):
         """
         Initialize SDC data client.
         
         Args:
             timeout_seconds: Socket timeout for SDS connections
+            max_idle_per_sds: Idle connections kept open per SDS data endpoint
+            max_workers: Threads for fanning replica IOs out in parallel
+            read_hedge_width: Replicas a read is sent to concurrently (first success wins)
         """
         self.timeout_seconds = timeout_seconds
+        self.max_idle_per_sds = max_idle_per_sds
+        self.read_hedge_width = max(1, read_hedge_width)
         self.protocol = SocketProtocol()
+        self._pool: Dict[Tuple[str, int], queue.Queue] = {}
+        self._pool_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sdc-io")
         logger.info(f"SDC data client initialized (timeout={timeout_seconds}s)")
     
+    def _idle_queue(self, key: Tuple[str, int]) -> queue.Queue:
+        with self._pool_lock:
+            idle = self._pool.get(key)
+            if idle is None:
+                idle = self._pool[key] = queue.Queue(maxsize=self.max_idle_per_sds)
+            return idle
+    
+    def _get_conn(self, sds_address: str, sds_data_port: int) -> Tuple[socket.socket, bool]:
+        """Return (socket, reused): an idle pooled connection, or a new one."""
+        idle = self._idle_queue((sds_address, sds_data_port))
+        while True:
+            try:
+                sock = idle.get_nowait()
+            except queue.Empty:
+                break
+            if self._is_reusable(sock):
+                return sock, True
+            sock.close()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        tune_data_socket(sock)
+        sock.settimeout(self.timeout_seconds)
+        try:
+            sock.connect((sds_address, sds_data_port))
+        except BaseException:
+            sock.close()
+            raise
+        return sock, False
+    
+    def _is_reusable(self, sock: socket.socket) -> bool:
+        """An idle connection is reusable only if nothing is readable: EOF means the SDS closed it."""
+        try:
+            sock.setblocking(False)
+            try:
+                sock.recv(1, socket.MSG_PEEK)
+            finally:
+                sock.settimeout(self.timeout_seconds)
+        except BlockingIOError:
+            return True
+        except OSError:
+            pass
+        return False
+    
+    def _put_conn(self, sds_address: str, sds_data_port: int, sock: socket.socket) -> None:
+        try:
+            self._idle_queue((sds_address, sds_data_port)).put_nowait(sock)
+        except queue.Full:
+            sock.close()
+    
+    def _exchange(
+        self,
+        sds_address: str,
+        sds_data_port: int,
+        request: Dict[str, Any],
+        payload: Optional[bytes] = None
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[bytes]]:
+        """
+        Send one request on a pooled connection and return (response, response_payload).
+        
+        A reused connection the SDS has since closed is retried on a fresh one only if
+        sending fails; once the request is on the wire it is never replayed, since the
+        SDS would reject its single-use token. Any failed connection is discarded
+        rather than returned to the pool.
+        """
+        while True:
+            sock, reused = self._get_conn(sds_address, sds_data_port)
+            try:
+                if payload is None:
+                    self.protocol.send_message(sock, request)
+                else:
+                    self.protocol.send_message_with_payload(sock, request, payload)
+            except ConnectionError:
+                sock.close()
+                if reused:
+                    continue
+                raise
+            except BaseException:
+                sock.close()
+                raise
+            
+            try:
+                response, data = self.protocol.receive_message_with_payload(sock)
+            except BaseException:
+                sock.close()
+                raise
+            
+            if response is None:
+                sock.close()
+                return None, None
+            
+            self._put_conn(sds_address, sds_data_port, sock)
+            return response, data
+    
+    def close(self) -> None:
+        """Stop the replica IO threads and close all idle pooled SDS connections."""
+        self._executor.shutdown(wait=False)
+        with self._pool_lock:
+            idle_queues = list(self._pool.values())
+            self._pool.clear()
+        for idle in idle_queues:
+            while True:
+                try:
+                    idle.get_nowait().close()
+                except queue.Empty:
+                    break
+    
     def execute_read(
         self,
         sds_address: str,
@@ -71,23 +194,15 @@ class SDCDataClient:
             "chunk_id": chunk_id,
             "offset_bytes": offset_bytes,
             "length_bytes": length_bytes,
+            "raw_payload": True,
             "token": token
         }
         
         try:
             logger.debug(f"READ to {sds_address}:{sds_data_port} chunk={chunk_id} offset={offset_bytes} len={length_bytes}")
             
-            # Connect to SDS
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout_seconds)
-            sock.connect((sds_address, sds_data_port))
-            
-            # Send request
-            self.protocol.send_message(sock, request)
-            
-            # Receive response
-            response = self.protocol.receive_message(sock)
-            sock.close()
+            # Send request; the response header is followed by the raw data
+            response, data_bytes = self._exchange(sds_address, sds_data_port, request)
             
             if not response:
                 return False, None, "Empty response from SDS"
@@ -97,12 +212,12 @@ class SDCDataClient:
                 logger.error(f"Read failed: {error_msg}")
                 return False, None, error_msg
             
-            # Decode base64 data
-            data_b64 = response.get("data_b64")
-            if not data_b64:
-                return False, None, "Missing data_b64 in response"
-            
-            data_bytes = base64.b64decode(data_b64)
+            if data_bytes is None:
+                # SDS without raw payload support: fall back to base64 data
+                data_b64 = response.get("data_b64")
+                if not data_b64:
+                    return False, None, "Missing data in response"
+                data_bytes = base64.b64decode(data_b64)
             
             logger.debug(f"Read successful: {len(data_bytes)} bytes from {sds_address}:{sds_data_port}")
             return True, data_bytes, None
@@ -144,32 +259,20 @@ class SDCDataClient:
         Returns:
             (success, error_message)
         """
-        data_b64 = base64.b64encode(data_bytes).decode("ascii")
-        
         request = {
             "operation": "WRITE",
             "volume_id": volume_id,
             "chunk_id": chunk_id,
             "offset_bytes": offset_bytes,
             "length_bytes": len(data_bytes),
-            "data_b64": data_b64,
             "token": token
         }
         
         try:
             logger.debug(f"WRITE to {sds_address}:{sds_data_port} chunk={chunk_id} offset={offset_bytes} len={len(data_bytes)}")
             
-            # Connect to SDS
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout_seconds)
-            sock.connect((sds_address, sds_data_port))
-            
-            # Send request
-            self.protocol.send_message(sock, request)
-            
-            # Receive response
-            response = self.protocol.receive_message(sock)
-            sock.close()
+            # Send request header followed by the raw data
+            response, _ = self._exchange(sds_address, sds_data_port, request, data_bytes)
             
             if not response:
                 return False, "Empty response from SDS"
@@ -203,8 +306,8 @@ class SDCDataClient:
         """
         Execute full IO plan (multi-replica read/write).
         
-        For reads: Try first replica, fall back to others on failure.
-        For writes: Write to all replicas (according to plan).
+        For reads: Hedged across the first replicas (first success wins), spilling to the others on failure.
+        For writes: Write to all replicas (according to plan) in parallel.
         
         Args:
             io_plan: IO plan from MDM token (contains replica list)
@@ -221,9 +324,8 @@ class SDCDataClient:
             return False, None, "No replicas in IO plan"
         
         if operation == "READ":
-            # Try each replica until success
-            for replica in replicas:
-                success, data, error = self.execute_read(
+            def read_replica(replica: Dict[str, Any]) -> Tuple[bool, Optional[bytes], Optional[str]]:
+                return self.execute_read(
                     sds_address=replica["sds_address"],
                     sds_data_port=replica["sds_data_port"],
                     volume_id=replica["volume_id"],
@@ -232,11 +334,31 @@ class SDCDataClient:
                     length_bytes=replica["length_bytes"],
                     token=token
                 )
-                
-                if success:
-                    return True, data, None
-                
-                logger.warning(f"Read from replica {replica['sds_address']}:{replica['sds_data_port']} failed: {error}")
+            
+            # Keep up to read_hedge_width replicas in flight: the first success wins, and each
+            # failure starts the next replica, so one slow or dead SDS does not stall the read
+            pending = list(replicas)
+            in_flight: Dict[Any, Dict[str, Any]] = {}
+            while pending and len(in_flight) < self.read_hedge_width:
+                replica = pending.pop(0)
+                in_flight[self._executor.submit(read_replica, replica)] = replica
+            
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    replica = in_flight.pop(future)
+                    success, data, error = future.result()
+                    
+                    if success:
+                        # Reads still running finish in the background and return their connections to the pool
+                        for other in in_flight:
+                            other.cancel()
+                        return True, data, None
+                    
+                    logger.warning(f"Read from replica {replica['sds_address']}:{replica['sds_data_port']} failed: {error}")
+                    if pending:
+                        replica = pending.pop(0)
+                        in_flight[self._executor.submit(read_replica, replica)] = replica
             
             return False, None, "All read replicas failed"
         
@@ -244,12 +366,10 @@ class SDCDataClient:
             if data_bytes is None:
                 return False, None, "No data provided for write"
             
-            # Write to all replicas
-            success_count = 0
-            errors = []
-            
-            for replica in replicas:
-                success, error = self.execute_write(
+            # Write to all replicas concurrently: latency is the slowest replica, not the sum.
+            # Every write is awaited so no replica is still in flight when the IO is acked.
+            def write_replica(replica: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
+                return self.execute_write(
                     sds_address=replica["sds_address"],
                     sds_data_port=replica["sds_data_port"],
                     volume_id=replica["volume_id"],
@@ -258,7 +378,16 @@ class SDCDataClient:
                     data_bytes=data_bytes,
                     token=token
                 )
-                
+            
+            if len(replicas) == 1:
+                results = [write_replica(replicas[0])]
+            else:
+                results = list(self._executor.map(write_replica, replicas))
+            
+            success_count = 0
+            errors = []
+            
+            for replica, (success, error) in zip(replicas, results):
                 if success:
                     success_count += 1
                 else:
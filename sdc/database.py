@@ -5,7 +5,7 @@ Manages sdc_local.db (SQLite) for SDC-specific state.
 Each SDC instance has its own database file.
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import StaticPool
 import logging
@@ -43,9 +43,35 @@ def init_sdc_database(sdc_id: str) -> tuple:
         echo=False
     )
     
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """
+        Tune the sdc_local.db connection.
+        WAL + synchronous=NORMAL: a commit no longer fsyncs; the cache tables only need
+        crash consistency, which WAL keeps.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+    
     # Create all tables
     Base.metadata.create_all(bind=engine)
     
+    # chunk_locations predating the unique (volume_id, chunk_id) index: drop duplicate cache
+    # rows (keeping the newest) so the index the plan_update upsert relies on can be built
+    chunk_indexes = {index["name"] for index in inspect(engine).get_indexes("chunk_locations")}
+    if "ux_chunk_locations_volume_chunk" not in chunk_indexes:
+        with engine.begin() as conn:
+            conn.execute(text(
+                "DELETE FROM chunk_locations WHERE id NOT IN "
+                "(SELECT MAX(id) FROM chunk_locations GROUP BY volume_id, chunk_id)"
+            ))
+            conn.execute(text(
+                "CREATE UNIQUE INDEX ux_chunk_locations_volume_chunk "
+                "ON chunk_locations (volume_id, chunk_id)"
+            ))
+    
     # Create scoped session factory
     session_factory = sessionmaker(bind=engine, autocommit=False, autoflush=False)
     SessionLocal = scoped_session(session_factory)
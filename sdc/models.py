@@ -12,7 +12,7 @@ Tables:
 - device_registry: NBD device→volume mappings
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, Float, create_engine
+from sqlalchemy import Column, Integer, String, DateTime, Float, Index, create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime
 
@@ -25,6 +25,9 @@ class ChunkLocation(Base):
     Avoids repeated MDM queries for chunk→SDS mapping.
     """
     __tablename__ = "chunk_locations"
+    __table_args__ = (
+        Index("ux_chunk_locations_volume_chunk", "volume_id", "chunk_id", unique=True),  # upsert target
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     volume_id = Column(Integer, nullable=False, index=True)
@@ -35,6 +35,7 @@ from pathlib import Path
 from shared.socket_protocol import SocketProtocol
 from sdc.token_requester import TokenRequester
 from sdc.data_client import SDCDataClient
+from sdc.control_app import get_cached_mapping
 
 logger = logging.getLogger(__name__)
 
@@ -110,6 +111,9 @@ class NBDServer:
         if self.server_thread:
             self.server_thread.join(timeout=5)
         
+        # Drop pooled SDS data connections
+        self.data_client.close()
+        
         logger.info("NBD server stopped")
     
     def _server_loop(self):
@@ -331,39 +335,19 @@ class NBDServer:
         logger.debug(f"Sent error: {error_message}")
     
     def _is_volume_mapped(self, volume_id: int) -> bool:
-        """Check if volume is mapped to this SDC"""
-        db = self.db_session_factory()
-        try:
-            from sdc.models import VolumeMappingCache
-            
-            mapping = db.query(VolumeMappingCache).filter(
-                VolumeMappingCache.volume_id == volume_id
-            ).first()
-            
-            return mapping is not None
-        
-        finally:
-            db.close()
+        """Check if volume is mapped to this SDC (in-memory mapping cache)"""
+        return get_cached_mapping(volume_id, self.db_session_factory) is not None
     
     def _get_volume_info(self, volume_id: int) -> Optional[dict]:
-        """Get volume information from cache"""
-        db = self.db_session_factory()
-        try:
-            from sdc.models import VolumeMappingCache
-            
-            mapping = db.query(VolumeMappingCache).filter(
-                VolumeMappingCache.volume_id == volume_id
-            ).first()
-            
-            if mapping:
-                return {
-                    "volume_id": volume_id,
-                    "volume_name": mapping.volume_name,  # type: ignore[attr-defined]
-                    "size_bytes": mapping.size_bytes,  # type: ignore[attr-defined]
-                    "access_mode": mapping.access_mode  # type: ignore[attr-defined]
-                }
-            
-            return None
+        """Get volume information from the in-memory mapping cache"""
+        mapping = get_cached_mapping(volume_id, self.db_session_factory)
+        
+        if mapping:
+            return {
+                "volume_id": volume_id,
+                "volume_name": mapping["volume_name"],
+                "size_bytes": mapping["size_bytes"],
+                "access_mode": mapping["access_mode"]
+            }
         
-        finally:
-            db.close()
+        return None
@@ -60,7 +60,8 @@ class SDCService:
         mgmt_port: int = 8004,
         mdm_address: str = "127.0.0.1",
         mdm_port: int = 8001,
-        cluster_secret: Optional[str] = None
+        cluster_secret: Optional[str] = None,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize SDC service.
@@ -75,6 +76,7 @@ class SDCService:
             mdm_address: MDM host for registration/tokens
             mdm_port: MDM port (default 8001)
             cluster_secret: Cluster secret for authentication
+            http_session: Shared keep-alive session for MDM calls (default: new session)
         """
         self.sdc_id = sdc_id
         self.sdc_component_id = sdc_component_id
@@ -85,6 +87,7 @@ class SDCService:
         self.mdm_address = mdm_address
         self.mdm_port = mdm_port
         self.cluster_secret = cluster_secret
+        self.http_session = http_session or requests.Session()
         
         # Initialize database
         self.engine, self.SessionLocal = init_sdc_database(self.sdc_component_id)
@@ -251,7 +254,7 @@ class SDCService:
         
         while self.running:
             try:
-                response = requests.post(heartbeat_url, timeout=5)
+                response = self.http_session.post(heartbeat_url, timeout=5)
                 
                 if response.status_code == 200:
                     logger.debug(f"Heartbeat sent: {self.sdc_component_id}")
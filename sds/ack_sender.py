@@ -9,7 +9,7 @@ import requests
 import threading
 import time
 import logging
-from typing import List
+from typing import List, Optional
 from datetime import datetime
 
 from sds.models import AckQueue
@@ -30,7 +30,8 @@ class AckSender:
         sds_id: int,
         sds_address: str,
         interval_seconds: int = 5,
-        batch_size: int = 100
+        batch_size: int = 100,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize ACK sender.
@@ -42,6 +43,7 @@ class AckSender:
             sds_address: SDS data port address (e.g., "10.0.1.10:9700")
             interval_seconds: Batch send interval (default: 5 seconds)
             batch_size: Max ACKs per batch (default: 100)
+            http_session: Keep-alive session for MDM calls (default: new session)
         """
         self.db_session_factory = db_session_factory
         self.mdm_url = mdm_url.rstrip("/")
@@ -49,6 +51,7 @@ class AckSender:
         self.sds_address = sds_address
         self.interval_seconds = interval_seconds
         self.batch_size = batch_size
+        self.http_session = http_session or requests.Session()
         
         self.running = False
         self.thread = None
@@ -161,7 +164,7 @@ class AckSender:
             if ack.error_message:
                 payload["error_message"] = ack.error_message
             
-            response = requests.post(
+            response = self.http_session.post(
                 endpoint,
                 json=payload,
                 timeout=10
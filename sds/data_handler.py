@@ -7,7 +7,9 @@ Listens on SDS_DATA_PORT (9700+n) and serves read/write requests from SDC.
 CRITICAL: Every IO request MUST include a valid authorization token from MDM.
 No token = no disk access.
 
-Protocol: Newline-delimited JSON over TCP (from shared/socket_protocol.py)
+Protocol: Newline-delimited JSON over TCP (from shared/socket_protocol.py).
+A header carrying "payload_bytes" is followed by that many raw bytes (write data
+in requests; read data in responses when the request sets "raw_payload").
 """
 
 import socket
@@ -20,7 +22,7 @@ from pathlib import Path
 from typing import Dict, Optional
 from datetime import datetime
 
-from shared.socket_protocol import SocketProtocol
+from shared.socket_protocol import SocketProtocol, tune_data_socket
 from sds.token_verifier import TokenVerifier
 from sds.database import get_db
 from sds.models import LocalReplica, LocalDevice, WriteJournal, AckQueue
@@ -72,6 +74,7 @@ class SDSDataHandler:
         """Start listening for IO requests"""
         self.server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        tune_data_socket(self.server_socket)  # Buffer sizes are inherited by accepted sockets
         self.server_socket.bind((self.host, self.port))
         self.server_socket.listen(5)
         self.running = True
@@ -81,6 +84,7 @@ class SDSDataHandler:
         while self.running:
             try:
                 client_socket, client_addr = self.server_socket.accept()
+                client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 logger.debug(f"Accepted connection from {client_addr}")
                 
                 # Handle each client in a separate thread
@@ -106,16 +110,20 @@ class SDSDataHandler:
         """Handle a single client connection"""
         try:
             while True:
-                # Receive JSON frame
-                frame = self.protocol.receive_frame(client_socket)
+                # Receive JSON frame (plus raw payload, if the header declares one)
+                frame, payload = self.protocol.receive_message_with_payload(client_socket)
                 if frame is None:
                     break  # Connection closed
                 
                 # Process request
-                response = self._process_request(frame)
+                response = self._process_request(frame, payload)
                 
-                # Send response
-                self.protocol.send_frame(client_socket, response)
+                # Send response; raw read data travels after the header instead of as base64
+                data = response.pop("_payload", None)
+                if data is None:
+                    self.protocol.send_frame(client_socket, response)
+                else:
+                    self.protocol.send_message_with_payload(client_socket, response, data)
                 
         except Exception as e:
             logger.error(f"Error handling client {client_addr}: {e}")
@@ -123,7 +131,7 @@ class SDSDataHandler:
             client_socket.close()
             logger.debug(f"Connection closed: {client_addr}")
     
-    def _process_request(self, request: Dict) -> Dict:
+    def _process_request(self, request: Dict, payload: Optional[bytes] = None) -> Dict:
         """
         Process IO request with token verification.
         
@@ -135,17 +143,18 @@ class SDSDataHandler:
             "chunk_id": int,
             "offset_bytes": int,
             "length_bytes": int,  # for read
-            "data_b64": str  # for write
+            "raw_payload": bool,  # for read: return data as a raw payload instead of data_b64
+            "data_b64": str  # for write, unless the data follows as a raw payload
         }
         """
-        action = request.get("action")
+        action = request.get("action") or str(request.get("operation", "")).lower()
         
         if action == "init_volume":
             return self._handle_init_volume(request)
         elif action == "read":
             return self._handle_read(request)
         elif action == "write":
-            return self._handle_write(request)
+            return self._handle_write(request, payload)
         else:
             return {"ok": False, "error": f"Unknown action: {action}"}
     
@@ -252,13 +261,17 @@ class SDSDataHandler:
             
             logger.info(f"Read successful: volume={volume_id}, chunk={chunk_id}, bytes={len(data)}")
             
-            return {
+            response = {
                 "ok": True,
-                "data_b64": base64.b64encode(data).decode("ascii"),
                 "bytes_read": len(data),
                 "generation": replica.generation,
                 "checksum": replica.checksum
             }
+            if request.get("raw_payload"):
+                response["_payload"] = data
+            else:
+                response["data_b64"] = base64.b64encode(data).decode("ascii")
+            return response
             
         except Exception as e:
             logger.error(f"Read error: {e}", exc_info=True)
@@ -266,7 +279,7 @@ class SDSDataHandler:
         finally:
             db.close()
     
-    def _handle_write(self, request: Dict) -> Dict:
+    def _handle_write(self, request: Dict, payload: Optional[bytes] = None) -> Dict:
         """Handle write request with token verification"""
         start_time = time.time()
         
@@ -287,14 +300,17 @@ class SDSDataHandler:
         if not isinstance(offset_bytes, int):
             return {"ok": False, "error": "Invalid offset_bytes type"}
         
-        if not data_b64 or not isinstance(data_b64, str):
-            return {"ok": False, "error": "Missing or invalid data_b64"}
-        
-        # Decode data
-        try:
-            data = base64.b64decode(data_b64)
-        except Exception as e:
-            return {"ok": False, "error": f"Invalid base64 data: {e}"}
+        if payload is not None:
+            data = payload
+        else:
+            if not data_b64 or not isinstance(data_b64, str):
+                return {"ok": False, "error": "Missing or invalid data_b64"}
+            
+            # Decode data
+            try:
+                data = base64.b64decode(data_b64)
+            except Exception as e:
+                return {"ok": False, "error": f"Invalid base64 data: {e}"}
         
         length_bytes = len(data)
         
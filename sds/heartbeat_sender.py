@@ -10,6 +10,7 @@ import threading
 import time
 import logging
 from datetime import datetime
+from typing import Optional
 from sqlalchemy.orm import Session
 
 from sds.models import SDSMetadata
@@ -27,7 +28,8 @@ class HeartbeatSender:
         db_session_factory,
         mdm_url: str,
         component_id: str,
-        interval_seconds: int = 10
+        interval_seconds: int = 10,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize heartbeat sender.
@@ -37,11 +39,13 @@ class HeartbeatSender:
             mdm_url: MDM base URL (e.g., "http://10.0.1.1:8001")
             component_id: Discovery component ID (e.g., "sds-10.0.1.10")
             interval_seconds: Heartbeat interval (default: 10 seconds)
+            http_session: Keep-alive session for MDM calls (default: new session)
         """
         self.db_session_factory = db_session_factory
         self.mdm_url = mdm_url.rstrip("/")
         self.component_id = component_id
         self.interval_seconds = interval_seconds
+        self.http_session = http_session or requests.Session()
         
         self.running = False
         self.thread = None
@@ -87,7 +91,7 @@ class HeartbeatSender:
         try:
             endpoint = f"{self.mdm_url}/discovery/heartbeat/{self.component_id}"
             
-            response = requests.post(
+            response = self.http_session.post(
                 endpoint,
                 timeout=5
             )
@@ -19,12 +19,14 @@ Usage:
 
 import argparse
 import logging
+import os
 import signal
 import sys
 import threading
-import time
 from datetime import datetime
+from typing import Optional
 
+import requests
 import uvicorn
 from sqlalchemy.orm import Session
 
@@ -61,7 +63,8 @@ class SDSService:
         control_host: str = "0.0.0.0",
         control_port: int = 9100,
         mgmt_host: str = "0.0.0.0",
-        mgmt_port: int = 9200
+        mgmt_port: int = 9200,
+        http_session: Optional[requests.Session] = None
     ):
         """
         Initialize SDS service.
@@ -78,6 +81,7 @@ class SDSService:
             control_port: Control server port (default: 9100)
             mgmt_host: Management server host (default: 0.0.0.0)
             mgmt_port: Management server port (default: 9200)
+            http_session: Shared keep-alive session for MDM calls (default: new session)
         """
         self.sds_id = sds_id
         self.component_id = component_id
@@ -91,6 +95,7 @@ class SDSService:
         self.control_port = control_port
         self.mgmt_host = mgmt_host
         self.mgmt_port = mgmt_port
+        self.http_session = http_session or requests.Session()
         
         # Components
         self.data_handler = None
@@ -105,11 +110,13 @@ class SDSService:
         # Shutdown coordination
         self.running = threading.Event()
         self.running.set()
+        self.stopped = threading.Event()  # Set once stop() has finished; main thread parks on it
         
-        logger.info(f"SDS Service initialized: sds_id={sds_id}, component={component_id}")
-        logger.info(f"  Data port: {data_host}:{data_port}")
-        logger.info(f"  Control port: {control_host}:{control_port}")
-        logger.info(f"  Management port: {mgmt_host}:{mgmt_port}")
+        logger.info(
+            "SDS Service initialized: sds_id=%s component=%s data=%s:%s control=%s:%s mgmt=%s:%s",
+            sds_id, component_id, data_host, data_port, control_host, control_port, mgmt_host, mgmt_port,
+            extra={"sds_id": sds_id, "component_id": component_id},
+        )
     
     def start(self):
         """
@@ -166,7 +173,8 @@ class SDSService:
             db_session_factory=session_factory,
             mdm_url=self.mdm_url,
             component_id=self.component_id,
-            interval_seconds=10
+            interval_seconds=10,
+            http_session=self.http_session
         )
         self.heartbeat_sender.start()
         
@@ -179,7 +187,8 @@ class SDSService:
             sds_id=self.sds_id,
             sds_address=sds_address,
             interval_seconds=5,
-            batch_size=100
+            batch_size=100,
+            http_session=self.http_session
         )
         self.ack_sender.start()
         
@@ -218,6 +227,7 @@ class SDSService:
         if self.mgmt_thread and self.mgmt_thread.is_alive():
             self.mgmt_thread.join(timeout=5)
         
+        self.stopped.set()
         logger.info("✓ SDS Service stopped")
     
     def _init_metadata(self):
@@ -396,10 +406,11 @@ def main():
     # Start service
     service.start()
     
-    # Keep main thread alive
+    # Keep main thread alive, parked on the stop event (no periodic wakeups).
+    # Windows can't interrupt an untimed wait with Ctrl+C, so it polls instead.
     try:
-        while service.running.is_set():
-            time.sleep(1)
+        while not service.stopped.wait(None if os.name == "posix" else 1.0):
+            pass
     except KeyboardInterrupt:
         logger.info("\nKeyboard interrupt, shutting down...")
         service.stop()
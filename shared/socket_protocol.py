@@ -4,9 +4,30 @@ import json
 import socket
 from typing import Any
 
+# One reusable compact encoder: json.dumps() with non-default arguments builds a new
+# JSONEncoder per call, and the default separators pad every frame with spaces
+_FRAME_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Socket buffer size for SDC<->SDS data connections (chunk payloads are up to several MiB)
+DATA_SOCKET_BUFFER_BYTES = 4 << 20
+
+
+def tune_data_socket(sock: socket.socket) -> None:
+    """
+    Data-path socket options: TCP_NODELAY so small header/ack frames are not held back by
+    Nagle, and large send/receive buffers for bulk payloads. Call before connect()/listen()
+    so the negotiated window scale covers the larger receive buffer.
+    """
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    for option in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, option, DATA_SOCKET_BUFFER_BYTES)
+        except OSError:
+            pass  # Kernel refused the size; keep its default
+
 
 def send_json_line(sock: socket.socket, payload: dict[str, Any]) -> None:
-    body = (json.dumps(payload) + "\n").encode("utf-8")
+    body = (_FRAME_ENCODER.encode(payload) + "\n").encode("utf-8")
     sock.sendall(body)
 
 
@@ -24,7 +45,66 @@ def read_json_line(sock: socket.socket) -> dict[str, Any]:
         raise ConnectionError("No data received")
 
     line = data.split(b"\n", 1)[0]
-    return json.loads(line.decode("utf-8"))
+    return json.loads(line)
+
+
+def recv_exact_into(sock: socket.socket, view: memoryview) -> None:
+    """Fill view completely from sock, receiving straight into it."""
+    while view:
+        received = sock.recv_into(view)
+        if not received:
+            raise ConnectionError("Connection closed mid-frame")
+        view = view[received:]
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytearray:
+    # One allocation of the final size; no per-recv chunks to join afterwards
+    buf = bytearray(size)
+    recv_exact_into(sock, memoryview(buf))
+    return buf
+
+
+def _recv_line(sock: socket.socket) -> bytes:
+    # Consume exactly one line: peek for the newline so bytes after it (a binary payload) stay in the socket
+    line = bytearray()
+    while True:
+        peeked = sock.recv(4096, socket.MSG_PEEK)
+        if not peeked:
+            raise ConnectionError("Connection closed mid-frame" if line else "No data received")
+        newline = peeked.find(b"\n")
+        if newline >= 0:
+            line += _recv_exact(sock, newline + 1)
+            return bytes(line[:-1])
+        line += _recv_exact(sock, len(peeked))
+
+
+def _send_parts(sock: socket.socket, header: bytes, payload: bytes) -> None:
+    if not hasattr(sock, "sendmsg"):
+        sock.sendall(header + payload)
+        return
+    # Scatter-gather send: the payload goes out without being copied onto the header
+    views = [memoryview(header), memoryview(payload)]
+    while views:
+        sent = sock.sendmsg(views)
+        while views and sent >= len(views[0]):
+            sent -= len(views.pop(0))
+        if views:
+            views[0] = views[0][sent:]
+
+
+def send_json_with_payload(sock: socket.socket, header: dict[str, Any], payload: bytes) -> None:
+    """Send a JSON header line carrying payload_bytes, followed by the raw payload bytes."""
+    line = (_FRAME_ENCODER.encode(dict(header, payload_bytes=len(payload))) + "\n").encode("utf-8")
+    _send_parts(sock, line, payload)
+
+
+def read_json_with_payload(sock: socket.socket) -> tuple[dict[str, Any], bytearray | None]:
+    """Read one JSON header line and, if it declares payload_bytes, exactly that many raw bytes."""
+    header = json.loads(_recv_line(sock))
+    size = header.get("payload_bytes")
+    if not isinstance(size, int):
+        return header, None
+    return header, _recv_exact(sock, size)
 
 
 class SocketProtocol:
@@ -42,3 +122,12 @@ class SocketProtocol:
 
     def receive_message(self, sock: socket.socket) -> dict[str, Any] | None:
         return self.receive_frame(sock)
+
+    def send_message_with_payload(self, sock: socket.socket, payload: dict[str, Any], data: bytes) -> None:
+        send_json_with_payload(sock, payload, data)
+
+    def receive_message_with_payload(self, sock: socket.socket) -> tuple[dict[str, Any] | None, bytearray | None]:
+        try:
+            return read_json_with_payload(sock)
+        except ConnectionError:
+            return None, None